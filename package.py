@@ -3,14 +3,19 @@
 Packaging script for LLDB Objective-C Tools.
 
 Creates a release zip file containing all necessary scripts for distribution.
+Zips are reproducible (fixed entry timestamps); when the inputs are unchanged
+since the last run, the existing zip in the output directory is reused.
 
 Usage:
     ./package.py              # Create release zip in current directory
     ./package.py --output DIR # Create release zip in specified directory
+    ./package.py --fast       # Favour packaging speed over archive size
 """
 
 import argparse
+import hashlib
 import os
+import stat
 import sys
 import zipfile
 from pathlib import Path
@@ -27,14 +32,14 @@ except ImportError:
     __version__ = "unknown"
 
 # Files to include in the release (relative to SCRIPT_DIR)
-RELEASE_FILES = [
+RELEASE_FILES = (
     "install.py",
     "README.md",
     "LICENSE",
-]
+)
 
 # Script files in scripts/ directory
-SCRIPT_FILES = [
+SCRIPT_FILES = (
     "scripts/__init__.py",
     "scripts/objc_breakpoint.py",
     "scripts/objc_sel.py",
@@ -48,17 +53,43 @@ SCRIPT_FILES = [
     "scripts/objc_utils.py",
     "scripts/objc_core.py",
     "scripts/version.py",
-]
+)
 
 # Combine all files
 ALL_RELEASE_FILES = RELEASE_FILES + SCRIPT_FILES
 
+# DEFLATE levels: smallest archive by default, fastest with --fast
+COMPRESS_LEVEL = 9
+FAST_COMPRESS_LEVEL = 1
 
-def create_release(output_dir: Path) -> Path:
+# Fixed timestamp for every zip entry so identical inputs give byte-identical zips
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def find_present_files() -> set:
+    """Find which release files exist, with one directory scan per directory.
+
+    Returns:
+        Set of paths (relative to SCRIPT_DIR, as in ALL_RELEASE_FILES) that exist
+    """
+    present = set()
+    for directory in {Path(filename).parent for filename in ALL_RELEASE_FILES}:
+        try:
+            with os.scandir(SCRIPT_DIR / directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        present.add((directory / entry.name).as_posix())
+        except FileNotFoundError:
+            continue
+    return present
+
+
+def create_release(output_dir: Path, fast: bool = False) -> Path:
     """Create a release zip file.
 
     Args:
         output_dir: Directory to create the zip file in
+        fast: Use the fastest DEFLATE level instead of the smallest output
 
     Returns:
         Path to the created zip file
@@ -73,11 +104,11 @@ def create_release(output_dir: Path) -> Path:
     # Collect files
     files_to_package = []
     missing_required = []
+    present_files = find_present_files()
 
     for filename in ALL_RELEASE_FILES:
-        file_path = SCRIPT_DIR / filename
-        if file_path.exists():
-            files_to_package.append((filename, file_path))
+        if filename in present_files:
+            files_to_package.append((filename, SCRIPT_DIR / filename))
         elif filename in ("README.md", "LICENSE"):
             # Optional files
             print(f"  Skipping (not found): {filename}")
@@ -91,13 +122,36 @@ def create_release(output_dir: Path) -> Path:
             print(f"  - {f}", file=sys.stderr)
         sys.exit(1)
 
-    # Create zip file
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for filename, file_path in files_to_package:
-            # Store files in a subdirectory named lldb-objc
-            arcname = f"lldb-objc/{filename}"
-            zf.write(file_path, arcname)
-            print(f"  Added: {filename}")
+    # Read inputs once and hash them (with the settings that affect the output)
+    compresslevel = FAST_COMPRESS_LEVEL if fast else COMPRESS_LEVEL
+    manifest = hashlib.sha256(f"{__version__}:{compresslevel}".encode())
+    entries = []
+    for filename, file_path in files_to_package:
+        # Store files in a subdirectory named lldb-objc
+        arcname = f"lldb-objc/{filename}"
+        data = file_path.read_bytes()
+        # Normalise permissions so the zip does not depend on the checkout's umask
+        mode = stat.S_IFREG | (0o755 if file_path.stat().st_mode & 0o111 else 0o644)
+        manifest.update(f"{arcname}:{mode:o}:{len(data)}:".encode())
+        manifest.update(data)
+        entries.append((filename, arcname, data, mode))
+    manifest_hash = manifest.hexdigest()
+
+    # Skip repackaging when the existing zip was built from identical inputs
+    manifest_path = output_dir / f".{zip_name}.sha256"
+    if (zip_path.exists() and manifest_path.exists()
+            and manifest_path.read_text().strip() == manifest_hash):
+        print("  Inputs unchanged, reusing existing package")
+    else:
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+            for filename, arcname, data, mode in entries:
+                info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+                info.external_attr = (mode & 0xFFFF) << 16
+                zf.writestr(info, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+                print(f"  Added: {filename}")
+        manifest_path.write_text(manifest_hash + "\n")
+
+    contents = [(arcname, len(data)) for _, arcname, data, _ in entries]
 
     print()
     print(f"Release package created: {zip_path}")
@@ -106,9 +160,8 @@ def create_release(output_dir: Path) -> Path:
     # Show contents
     print()
     print("Contents:")
-    with zipfile.ZipFile(zip_path, 'r') as zf:
-        for info in zf.infolist():
-            print(f"  {info.filename} ({info.file_size:,} bytes)")
+    for arcname, file_size in contents:
+        print(f"  {arcname} ({file_size:,} bytes)")
 
     return zip_path
 
@@ -122,6 +175,7 @@ def main():
 Examples:
   ./package.py                    Create release zip in current directory
   ./package.py --output ~/releases  Create release zip in specified directory
+  ./package.py --fast             Package quickly (larger zip)
         """
     )
 
@@ -132,6 +186,12 @@ Examples:
         help="Output directory for the release zip (default: current directory)"
     )
 
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Use the fastest compression level (larger zip, quicker packaging)"
+    )
+
     args = parser.parse_args()
 
     # Validate output directory
@@ -143,7 +203,7 @@ Examples:
         sys.exit(1)
 
     try:
-        zip_path = create_release(args.output)
+        zip_path = create_release(args.output, fast=args.fast)
         print()
         print("To install from this release:")
         print(f"  1. Unzip: unzip {zip_path.name}")
@@ -21,7 +21,9 @@ import sys
 from pathlib import Path
 from typing import Dict, Any
 
-# Add the script directory to path for imports
+# Add the script directory to path for imports. Command modules loaded through
+# this package (__package__ set) rely on it and skip their own copy of this
+# setup, which only runs when they are imported standalone.
 script_dir = os.path.dirname(os.path.abspath(__file__))
 if script_dir not in sys.path:
     sys.path.insert(0, script_dir)
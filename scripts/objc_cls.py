@@ -66,9 +66,10 @@ from typing import Any, Dict, List, Optional, Tuple
 DEFAULT_BATCH_SIZE = 35
 
 # Add the script directory to path for version import
-script_dir = os.path.dirname(os.path.abspath(__file__))
-if script_dir not in sys.path:
-    sys.path.insert(0, script_dir)
+if not __package__:
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
 
 try:
     from version import __version__
@@ -14,6 +14,15 @@ from __future__ import annotations
 import re
 from typing import Optional, Tuple
 
+# Method signature grammar: [-+]?[ClassName selector], closing bracket optional.
+# A trailing ] is always the closing bracket, never (part of) the selector.
+_METHOD_SIGNATURE_RE = re.compile(r'^([-+]?)\[\s*(\S+)\s+(\S.*?)\s*(?:\]|(?<!\]))$')
+_METHOD_TYPE_BY_PREFIX = {'-': True, '+': False, '': None}
+
+# Constant parse_method_signature() error results (returned as-is, never rebuilt)
+_ERR_PREFIX = (None, None, None, "Expected -[ClassName selector:], +[ClassName selector:], or [ClassName selector:]")
+_ERR_FORMAT = (None, None, None, "Invalid format. Expected: [ClassName selector:]")
+
 
 def unquote_string(s: Optional[str]) -> Optional[str]:
     """
@@ -36,9 +45,11 @@ def unquote_string(s: Optional[str]) -> Optional[str]:
         >>> unquote_string('no quotes')
         'no quotes'
     """
-    if s and len(s) >= 2 and s.startswith('"') and s.endswith('"'):
-        return s[1:-1].replace('\\"', '"')
-    return s
+    if not s or len(s) < 2 or s[0] != '"' or s[-1] != '"':
+        return s
+    inner = s[1:-1]
+    # Common case (plain class/selector names) has no escaped quotes to replace
+    return inner.replace('\\"', '"') if '\\"' in inner else inner
 
 
 def parse_method_signature(command: str) -> Tuple[Optional[bool], Optional[str], Optional[str], Optional[str]]:
@@ -54,29 +65,17 @@ def parse_method_signature(command: str) -> Tuple[Optional[bool], Optional[str],
         On error, all values are None except error_message
     """
     command = command.strip()
+    match = _METHOD_SIGNATURE_RE.match(command)
+
+    if not match:
+        if command.startswith(('-[', '+[', '[')):
+            return _ERR_FORMAT
+        return _ERR_PREFIX
+
+    prefix, class_name, selector = match.groups()
 
-    # Determine method type based on prefix
-    if command.startswith('-['):
-        is_instance_method = True
-        start_idx = 2
-    elif command.startswith('+['):
-        is_instance_method = False
-        start_idx = 2
-    elif command.startswith('['):
-        is_instance_method = None  # Signal auto-detect needed
-        start_idx = 1
-    else:
-        return None, None, None, "Expected -[ClassName selector:], +[ClassName selector:], or [ClassName selector:]"
-
-    # Remove the leading prefix and trailing ]
-    method_str = command[start_idx:-1] if command.endswith(']') else command[start_idx:]
-    parts = method_str.split(None, 1)  # Split on first whitespace
-
-    if len(parts) != 2:
-        return None, None, None, "Invalid format. Expected: [ClassName selector:]"
-
-    class_name = parts[0]
-    selector = parts[1]
+    # Determine method type based on prefix (bare [ signals auto-detect)
+    is_instance_method = _METHOD_TYPE_BY_PREFIX[prefix]
 
     return is_instance_method, class_name, selector, None
 
@@ -12,15 +12,17 @@ For pure Python utilities (parsing, formatting), see objc_core.py
 
 from __future__ import annotations
 
+import functools
 import lldb
 import os
 import sys
-from typing import Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple
 
 # Add the script directory to path for imports
-script_dir = os.path.dirname(os.path.abspath(__file__))
-if script_dir not in sys.path:
-    sys.path.insert(0, script_dir)
+if not __package__:
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
 
 try:
     from version import __version__
@@ -36,23 +38,279 @@ from objc_core import (
     extract_category_from_symbol
 )
 
+# Per-process caches, keyed on SBProcess.GetUniqueID() (PIDs are reused by
+# relaunched processes). Only entries for the most recently used process are
+# kept. IMPs are never cached: categories and swizzling can change them at any
+# time, so class_getMethodImplementation() is always re-queried.
+
+# Global cache for class pointers, shared by every selector resolved on a class
+# Structure: {process_uid: {class_name: class_ptr}}
+_class_pointer_cache: Dict[int, Dict[str, int]] = {}
+
+# Global cache for selector pointers (selectors are never unregistered)
+# Structure: {process_uid: {selector: sel_ptr}}
+_selector_pointer_cache: Dict[int, Dict[str, int]] = {}
+
+# Global cache for runtime function callees used in resolution expressions
+# Structure: {process_uid: {function_name: callee_expression}}
+_runtime_callee_cache: Dict[int, Dict[str, str]] = {}
+
+# Runtime functions called by resolution expressions, with their C pointer types
+_RUNTIME_FUNCTION_TYPES = {
+    'NSClassFromString': 'Class (*)(id)',
+    'NSSelectorFromString': 'SEL (*)(id)',
+    'object_getClass': 'Class (*)(id)',
+    'class_getMethodImplementation': 'void *(*)(Class, SEL)',
+}
+
+# Default callees: plain function names, resolved by Clang on every compile
+_RUNTIME_FUNCTION_NAMES = {name: name for name in _RUNTIME_FUNCTION_TYPES}
+
+# Expression templates for runtime resolution (filled in with str.format,
+# runtime functions referenced by name so callees can be substituted)
+_CLASS_PTR_TPL = '(Class)0x{:x}'
+_CLASS_FROM_STRING_TPL = '(Class){NSClassFromString}(@"{class_name}")'
+_SEL_PTR_TPL = '(SEL)0x{:x}'
+_SEL_FROM_STRING_TPL = '(SEL){NSSelectorFromString}(@"{selector}")'
+_METACLASS_TPL = '(Class){object_getClass}((id)r.cls)'
+_FUSED_RESOLVE_TPL = '''({{
+        struct {{ Class cls; SEL sel; void *imp; }} r;
+        r.cls = {class_init};
+        r.sel = {sel_init};
+        r.imp = (r.cls && r.sel) ? (void *){class_getMethodImplementation}({lookup_class}, r.sel) : (void *)0;
+        r;
+    }})'''
 
-def resolve_method_address(
+# Shared options for runtime-resolution expressions (created lazily, reused across calls)
+_expression_options: Optional[lldb.SBExpressionOptions] = None
+
+
+def get_expression_options() -> lldb.SBExpressionOptions:
+    """
+    Get the shared SBExpressionOptions used for runtime-resolution expressions.
+
+    Forces Objective-C so lookups work from Swift/C frames, unwinds the inferior
+    on error, and skips debug info generation for the JIT'd code. The options
+    object is built once and reused for every evaluation.
+
+    Returns:
+        The shared lldb.SBExpressionOptions instance
+    """
+    global _expression_options
+
+    if _expression_options is None:
+        options = lldb.SBExpressionOptions()
+        options.SetLanguage(lldb.eLanguageTypeObjC)
+        options.SetUnwindOnError(True)
+        options.SetIgnoreBreakpoints(True)
+        options.SetGenerateDebugInfo(False)
+        _expression_options = options
+
+    return _expression_options
+
+
+def _process_cache(cache: Dict[int, Dict[str, Any]], process: lldb.SBProcess) -> Dict[str, Any]:
+    """Return this process's entries in cache, dropping those of any other process."""
+    uid = process.GetUniqueID()
+    entries = cache.get(uid)
+    if entries is None:
+        cache.clear()
+        entries = cache[uid] = {}
+    return entries
+
+
+def lookup_class_symbol(target: lldb.SBTarget, class_name: str, metaclass: bool = False) -> int:
+    """
+    Look up a class (or metaclass) object address from the symbol table.
+
+    Objective-C classes are exported as _OBJC_CLASS_$_Name / _OBJC_METACLASS_$_Name,
+    which LLDB indexes as eSymbolTypeObjCClass / eSymbolTypeObjCMetaClass symbols
+    named after the class. Reading them needs no expression evaluation. Classes
+    registered at runtime or stripped from the symbol table are not found.
+
+    Args:
+        target: The LLDB SBTarget to search
+        class_name: Name of the Objective-C class
+        metaclass: If True, look up the metaclass instead of the class
+
+    Returns:
+        The class object's load address, or 0 if no loaded symbol was found
+    """
+    symbol_type = lldb.eSymbolTypeObjCMetaClass if metaclass else lldb.eSymbolTypeObjCClass
+    return _lookup_symbol_load_address(target, class_name, symbol_type)
+
+
+def _lookup_symbol_load_address(target: lldb.SBTarget, name: str, symbol_type: int) -> int:
+    """Return the load address of the first loaded symbol with this name and type, or 0."""
+    symbol_contexts = target.FindSymbols(name, symbol_type)
+
+    for i in range(symbol_contexts.GetSize()):
+        symbol = symbol_contexts.GetContextAtIndex(i).GetSymbol()
+        if not symbol.IsValid():
+            continue
+        load_addr = symbol.GetStartAddress().GetLoadAddress(target)
+        if load_addr not in (0, lldb.LLDB_INVALID_ADDRESS):
+            return load_addr
+
+    return 0
+
+
+def _get_runtime_callees(target: lldb.SBTarget) -> Dict[str, str]:
+    """
+    Get callee expressions for the runtime functions used in resolution expressions.
+
+    Function addresses are looked up in the symbol table once per process and
+    embedded as function-pointer casts, so Clang does not have to search the
+    Foundation/libobjc debug info for each name on every compile. Functions
+    that cannot be found keep their plain name. On arm64e, indirect calls
+    through raw (unsigned) pointers would fail pointer authentication, so plain
+    names are always used there.
+
+    Args:
+        target: The LLDB SBTarget of the stopped process
+
+    Returns:
+        Dict mapping runtime function name to the callee expression to use
+    """
+    cached_callees = _process_cache(_runtime_callee_cache, target.GetProcess())
+    if cached_callees:
+        return cached_callees
+
+    if 'arm64e' in target.GetTriple():
+        cached_callees.update(_RUNTIME_FUNCTION_NAMES)
+        return cached_callees
+
+    callees = dict(_RUNTIME_FUNCTION_NAMES)
+    all_found = True
+    for name, function_type in _RUNTIME_FUNCTION_TYPES.items():
+        addr = _lookup_symbol_load_address(target, name, lldb.eSymbolTypeCode)
+        if addr:
+            callees[name] = f'(({function_type})0x{addr:x})'
+        else:
+            all_found = False
+
+    # Only cache a complete set; libraries may not be loaded yet (e.g. early stops)
+    if all_found:
+        cached_callees.update(callees)
+
+    return callees
+
+
+def _evaluate_method_pointers(
+    frame: lldb.SBFrame,
+    target: lldb.SBTarget,
+    class_name: str,
+    selector: str,
+    is_instance_method: bool,
+    verbose: bool = False,
+    class_ptr_hint: int = 0,
+    sel_ptr_hint: int = 0
+) -> Tuple[int, int, int, Optional[str], Optional[str]]:
+    """
+    Evaluate the Class, SEL and IMP pointers in a single fused expression.
+
+    One expression replaces the three separate lookups, so the method is
+    resolved with a single JIT compile and inferior resume. Class pointers that
+    are already known (class_ptr_hint) or found in the symbol table, and known
+    SEL pointers (sel_ptr_hint), are embedded as constants, leaving only first
+    lookups to NSClassFromString() and NSSelectorFromString(). If the fused
+    expression fails to evaluate, falls back to the stepwise lookups so the
+    error message pinpoints the failing step.
+
+    Args:
+        frame: The LLDB SBFrame to use for expression evaluation
+        target: The frame's SBTarget (for symbol lookups)
+        class_name: Name of the Objective-C class
+        selector: The selector string (e.g., "initWithFrame:")
+        is_instance_method: True for instance methods (-), False for class methods (+)
+        verbose: If True, print resolution details
+        class_ptr_hint: Class pointer from an earlier resolution in this process (0 if unknown)
+        sel_ptr_hint: SEL pointer from an earlier resolution in this process (0 if unknown)
+
+    Returns:
+        Tuple of (class_ptr, sel_ptr, imp_addr, imp_display, error_message)
+        - imp_display: LLDB's formatted IMP value for verbose output
+        On error, pointers resolved so far are returned alongside error_message
+    """
+    # Prefer known class/metaclass addresses (earlier resolution, then the
+    # symbol table) over runtime lookups
+    callees = _get_runtime_callees(target)
+    known_class_ptr = class_ptr_hint or lookup_class_symbol(target, class_name)
+    if known_class_ptr:
+        class_init = _CLASS_PTR_TPL.format(known_class_ptr)
+    else:
+        class_init = _CLASS_FROM_STRING_TPL.format(class_name=class_name, **callees)
+
+    if sel_ptr_hint:
+        sel_init = _SEL_PTR_TPL.format(sel_ptr_hint)
+    else:
+        sel_init = _SEL_FROM_STRING_TPL.format(selector=selector, **callees)
+
+    symbol_metaclass_ptr = 0
+    if known_class_ptr and not is_instance_method:
+        symbol_metaclass_ptr = lookup_class_symbol(target, class_name, metaclass=True)
+
+    if is_instance_method:
+        lookup_class = 'r.cls'
+    elif symbol_metaclass_ptr:
+        lookup_class = _CLASS_PTR_TPL.format(symbol_metaclass_ptr)
+    else:
+        lookup_class = _METACLASS_TPL.format(**callees)
+
+    fused_expr = _FUSED_RESOLVE_TPL.format(
+        class_init=class_init,
+        sel_init=sel_init,
+        lookup_class=lookup_class,
+        **callees
+    )
+
+    fused_result = frame.EvaluateExpression(fused_expr, get_expression_options())
+    if not fused_result.IsValid() or fused_result.GetError().Fail():
+        return _evaluate_method_pointers_stepwise(frame, class_name, selector, is_instance_method, verbose)
+
+    class_value = fused_result.GetChildMemberWithName('cls')
+    sel_value = fused_result.GetChildMemberWithName('sel')
+    imp_value = fused_result.GetChildMemberWithName('imp')
+    if not (class_value.IsValid() and sel_value.IsValid() and imp_value.IsValid()):
+        return _evaluate_method_pointers_stepwise(frame, class_name, selector, is_instance_method, verbose)
+
+    class_ptr = class_value.GetValueAsUnsigned()
+
+    if verbose:
+        print(f"  Class: {class_value.GetValue()}")
+
+    if class_ptr == 0:
+        return 0, 0, 0, None, f"Class '{class_name}' not found"
+
+    sel_ptr = sel_value.GetValueAsUnsigned()
+
+    if verbose:
+        print(f"  SEL: {sel_value.GetValue()}")
+
+    if sel_ptr == 0:
+        return class_ptr, 0, 0, None, f"Selector '{selector}' not found"
+
+    imp_addr = imp_value.GetValueAsUnsigned()
+
+    if imp_addr == 0:
+        if verbose:
+            print(f"  IMP: {imp_value.GetValue()}")
+        return class_ptr, sel_ptr, 0, None, "Method implementation not found"
+
+    return class_ptr, sel_ptr, imp_addr, imp_value.GetValue(), None
+
+
+def _evaluate_method_pointers_stepwise(
     frame: lldb.SBFrame,
     class_name: str,
     selector: str,
     is_instance_method: bool,
     verbose: bool = False
-) -> Tuple[lldb.SBAddress, int, int, Optional[str]]:
+) -> Tuple[int, int, int, Optional[str], Optional[str]]:
     """
-    Resolve an Objective-C method to its implementation address.
+    Evaluate the Class, SEL and IMP pointers one expression at a time.
 
-    Uses runtime introspection:
-    1. NSClassFromString() to get Class pointer
-    2. NSSelectorFromString() to get SEL pointer
-    3. object_getClass() for metaclass (class methods)
-    4. class_getMethodImplementation() to get IMP address
-    5. ResolveLoadAddress() to get proper SBAddress for breakpoints
+    Slower than the fused expression but reports which step failed.
 
     Args:
         frame: The LLDB SBFrame to use for expression evaluation
@@ -62,20 +320,18 @@ def resolve_method_address(
         verbose: If True, print resolution details
 
     Returns:
-        Tuple of (resolved_address, class_ptr, sel_ptr, error_message)
-        - resolved_address: lldb.SBAddress (invalid on error)
-        - class_ptr, sel_ptr: int pointers for reference
-        On error, resolved_address is invalid and error_message describes the issue
+        Tuple of (class_ptr, sel_ptr, imp_addr, imp_display, error_message)
+        - imp_display: LLDB's formatted IMP value for verbose output
+        On error, pointers resolved so far are returned alongside error_message
     """
-    # Step 1: Get the class using NSClassFromString
-    target = frame.GetThread().GetProcess().GetTarget()
-    invalid_addr = lldb.SBAddress()
+    options = get_expression_options()
 
-    class_expr = f'(Class)NSClassFromString(@"{class_name}")'
-    class_result = frame.EvaluateExpression(class_expr)
+    # Step 1: Get the class using NSClassFromString
+    class_expr = _CLASS_FROM_STRING_TPL.format(class_name=class_name, **_RUNTIME_FUNCTION_NAMES)
+    class_result = frame.EvaluateExpression(class_expr, options)
 
     if not class_result.IsValid() or class_result.GetError().Fail():
-        return invalid_addr, 0, 0, f"Failed to resolve class '{class_name}': {class_result.GetError()}"
+        return 0, 0, 0, None, f"Failed to resolve class '{class_name}': {class_result.GetError()}"
 
     class_ptr = class_result.GetValueAsUnsigned()
 
@@ -83,14 +339,14 @@ def resolve_method_address(
         print(f"  Class: {class_result.GetValue()}")
 
     if class_ptr == 0:
-        return invalid_addr, 0, 0, f"Class '{class_name}' not found"
+        return 0, 0, 0, None, f"Class '{class_name}' not found"
 
     # Step 2: Get the selector using NSSelectorFromString
-    sel_expr = f'(SEL)NSSelectorFromString(@"{selector}")'
-    sel_result = frame.EvaluateExpression(sel_expr)
+    sel_expr = _SEL_FROM_STRING_TPL.format(selector=selector, **_RUNTIME_FUNCTION_NAMES)
+    sel_result = frame.EvaluateExpression(sel_expr, options)
 
     if not sel_result.IsValid() or sel_result.GetError().Fail():
-        return invalid_addr, class_ptr, 0, f"Failed to resolve selector '{selector}': {sel_result.GetError()}"
+        return class_ptr, 0, 0, None, f"Failed to resolve selector '{selector}': {sel_result.GetError()}"
 
     sel_ptr = sel_result.GetValueAsUnsigned()
 
@@ -98,34 +354,84 @@ def resolve_method_address(
         print(f"  SEL: {sel_result.GetValue()}")
 
     if sel_ptr == 0:
-        return invalid_addr, class_ptr, 0, f"Selector '{selector}' not found"
+        return class_ptr, 0, 0, None, f"Selector '{selector}' not found"
 
-    # Step 3: For class methods, get the metaclass
-    lookup_class_ptr = class_ptr
-    if not is_instance_method:
-        metaclass_expr = f'(Class)object_getClass((id)0x{class_ptr:x})'
-        metaclass_result = frame.EvaluateExpression(metaclass_expr)
-
-        if not metaclass_result.IsValid() or metaclass_result.GetError().Fail():
-            return invalid_addr, class_ptr, sel_ptr, f"Failed to get metaclass: {metaclass_result.GetError()}"
-
-        lookup_class_ptr = metaclass_result.GetValueAsUnsigned()
+    # Step 3: Get the method implementation using class_getMethodImplementation
+    # For class methods the metaclass lookup is folded into the same expression
+    if is_instance_method:
+        lookup_class_expr = f'(Class)0x{class_ptr:x}'
+    else:
+        lookup_class_expr = f'(Class)object_getClass((id)0x{class_ptr:x})'
 
-    # Step 4: Get the method implementation using class_getMethodImplementation
-    imp_expr = f'(void *)class_getMethodImplementation((Class)0x{lookup_class_ptr:x}, (SEL)0x{sel_ptr:x})'
-    imp_result = frame.EvaluateExpression(imp_expr)
+    imp_expr = f'(void *)class_getMethodImplementation({lookup_class_expr}, (SEL)0x{sel_ptr:x})'
+    imp_result = frame.EvaluateExpression(imp_expr, options)
 
     if not imp_result.IsValid() or imp_result.GetError().Fail():
-        return invalid_addr, class_ptr, sel_ptr, f"Failed to get method implementation: {imp_result.GetError()}"
+        return class_ptr, sel_ptr, 0, None, f"Failed to get method implementation: {imp_result.GetError()}"
 
     imp_addr = imp_result.GetValueAsUnsigned()
 
     if imp_addr == 0:
         if verbose:
             print(f"  IMP: {imp_result.GetValue()}")
-        return invalid_addr, class_ptr, sel_ptr, "Method implementation not found"
+        return class_ptr, sel_ptr, 0, None, "Method implementation not found"
+
+    return class_ptr, sel_ptr, imp_addr, imp_result.GetValue(), None
 
-    # Step 5: Resolve load address to SBAddress and check for forwarding or inheritance
+
+def resolve_method_address(
+    frame: lldb.SBFrame,
+    class_name: str,
+    selector: str,
+    is_instance_method: bool,
+    verbose: bool = False
+) -> Tuple[lldb.SBAddress, int, int, Optional[str]]:
+    """
+    Resolve an Objective-C method to its implementation address.
+
+    Uses runtime introspection, fused into a single expression:
+    1. NSClassFromString() to get Class pointer
+    2. NSSelectorFromString() to get SEL pointer
+    3. class_getMethodImplementation() to get IMP address, going through
+       object_getClass() for class methods (metaclass)
+    4. ResolveLoadAddress() to get proper SBAddress for breakpoints
+
+    Class and SEL pointers are cached per process and embedded as constants,
+    so resolving further selectors on a known class only needs the IMP
+    lookup. The IMP itself is looked up on every call, so categories loaded
+    or methods swizzled since the last resolution are picked up.
+
+    Args:
+        frame: The LLDB SBFrame to use for expression evaluation
+        class_name: Name of the Objective-C class
+        selector: The selector string (e.g., "initWithFrame:")
+        is_instance_method: True for instance methods (-), False for class methods (+)
+        verbose: If True, print resolution details
+
+    Returns:
+        Tuple of (resolved_address, class_ptr, sel_ptr, error_message)
+        - resolved_address: lldb.SBAddress (invalid on error)
+        - class_ptr, sel_ptr: int pointers for reference
+        On error, resolved_address is invalid and error_message describes the issue
+    """
+    process = frame.GetThread().GetProcess()
+    target = process.GetTarget()
+    invalid_addr = lldb.SBAddress()
+
+    class_pointers = _process_cache(_class_pointer_cache, process)
+    selector_pointers = _process_cache(_selector_pointer_cache, process)
+    class_ptr, sel_ptr, imp_addr, imp_display, error = _evaluate_method_pointers(
+        frame, target, class_name, selector, is_instance_method, verbose,
+        class_pointers.get(class_name, 0), selector_pointers.get(selector, 0)
+    )
+    if class_ptr:
+        class_pointers[class_name] = class_ptr
+    if sel_ptr:
+        selector_pointers[selector] = sel_ptr
+    if error:
+        return invalid_addr, class_ptr, sel_ptr, error
+
+    # Step 4: Resolve load address to SBAddress and check for forwarding or inheritance
     addr = target.ResolveLoadAddress(imp_addr)
     inherited_from = None
 
@@ -139,7 +445,7 @@ def resolve_method_address(
             # Check for forwarding stub
             if 'msgForward' in symbol_name:
                 if verbose:
-                    print(f"  IMP: {imp_result.GetValue()}")
+                    print(f"  IMP: {imp_display}")
                 method_type = "instance" if is_instance_method else "class"
                 return invalid_addr, class_ptr, sel_ptr, (
                     f"Method not implemented: {method_type} method '{selector}' "
@@ -155,9 +461,9 @@ def resolve_method_address(
     if verbose:
         if inherited_from:
             prefix = '-' if is_instance_method else '+'
-            print(f"  IMP: {imp_result.GetValue()} \033[90m(inherited from {prefix}[{inherited_from} {selector}])\033[0m")
+            print(f"  IMP: {imp_display} \033[90m(inherited from {prefix}[{inherited_from} {selector}])\033[0m")
         else:
-            print(f"  IMP: {imp_result.GetValue()}")
+            print(f"  IMP: {imp_display}")
 
     return addr, class_ptr, sel_ptr, None
 
@@ -194,7 +500,7 @@ def detect_method_type(
         (void *)class_getClassMethod(cls, sel);
     }})'''
 
-    class_result = frame.EvaluateExpression(check_expr)
+    class_result = frame.EvaluateExpression(check_expr, get_expression_options())
     if class_result.IsValid() and not class_result.GetError().Fail():
         has_class_method = class_result.GetValueAsUnsigned() != 0
         if has_class_method:
@@ -210,7 +516,7 @@ def detect_method_type(
         (void *)class_getInstanceMethod(cls, sel);
     }})'''
 
-    instance_result = frame.EvaluateExpression(check_expr)
+    instance_result = frame.EvaluateExpression(check_expr, get_expression_options())
     if instance_result.IsValid() and not instance_result.GetError().Fail():
         has_instance_method = instance_result.GetValueAsUnsigned() != 0
         if has_instance_method:
@@ -224,7 +530,21 @@ def detect_method_type(
     return True
 
 
-def get_arch_registers(frame: lldb.SBFrame) -> Tuple[str, str, List[str]]:
+@functools.lru_cache(maxsize=8)
+def _registers_for_triple(triple: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """Map a target triple to its (self_reg, cmd_reg, arg_regs) register names."""
+    if 'arm64' in triple or 'aarch64' in triple:
+        # ARM64: x0=self, x1=_cmd, x2-x7=args
+        return ('x0', 'x1', ('x2', 'x3', 'x4', 'x5', 'x6', 'x7'))
+    else:
+        # x86_64: rdi=self, rsi=_cmd, rdx, rcx, r8, r9=args
+        return ('rdi', 'rsi', ('rdx', 'rcx', 'r8', 'r9'))
+
+
+def get_arch_registers(
+    frame: lldb.SBFrame,
+    triple: Optional[str] = None
+) -> Tuple[str, str, Tuple[str, ...]]:
     """
     Get the appropriate register names for the current architecture.
 
@@ -232,19 +552,17 @@ def get_arch_registers(frame: lldb.SBFrame) -> Tuple[str, str, List[str]]:
     - ARM64: x0=self, x1=_cmd, x2-x7=args
     - x86_64: rdi=self, rsi=_cmd, rdx, rcx, r8, r9=args
 
+    The mapping is cached per target triple, so repeated calls (e.g. from
+    owatch breakpoint callbacks) return the same shared tuple.
+
     Args:
         frame: The LLDB SBFrame
+        triple: Target triple if already known (skips the frame -> target lookup)
 
     Returns:
-        Tuple of (self_reg, cmd_reg, arg_regs) where arg_regs is a list of
+        Tuple of (self_reg, cmd_reg, arg_regs) where arg_regs is a tuple of
         additional argument register names.
     """
-    target = frame.GetThread().GetProcess().GetTarget()
-    triple = target.GetTriple()
-
-    if 'arm64' in triple or 'aarch64' in triple:
-        # ARM64: x0=self, x1=_cmd, x2-x7=args
-        return ('x0', 'x1', ['x2', 'x3', 'x4', 'x5', 'x6', 'x7'])
-    else:
-        # x86_64: rdi=self, rsi=_cmd, rdx, rcx, r8, r9=args
-        return ('rdi', 'rsi', ['rdx', 'rcx', 'r8', 'r9'])
+    if triple is None:
+        triple = frame.GetThread().GetProcess().GetTarget().GetTriple()
+    return _registers_for_triple(triple)
@@ -31,12 +31,13 @@ import os
 import shlex
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # Add the script directory to path for imports
-script_dir = os.path.dirname(os.path.abspath(__file__))
-if script_dir not in sys.path:
-    sys.path.insert(0, script_dir)
+if not __package__:
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
 
 try:
     from version import __version__
@@ -94,7 +95,7 @@ def _get_arg_count_from_method(method_name: str) -> int:
 def _get_arg_values(
     frame: lldb.SBFrame,
     process: lldb.SBProcess,
-    arg_regs: List[str],
+    arg_regs: Sequence[str],
     arg_count: int
 ) -> List[str]:
     """Get formatted argument values from registers."""
@@ -206,7 +207,7 @@ def watch_callback(
 
     # Common setup
     timestamp = get_timestamp()
-    self_reg, cmd_reg, arg_regs = get_arch_registers(frame)
+    self_reg, cmd_reg, arg_regs = get_arch_registers(frame, watch_info.get('triple'))
     arg_count = _get_arg_count_from_method(method_name)
 
     # Get caller info if needed (used by both --stack modes)
@@ -451,7 +452,8 @@ return objc_watch.watch_callback(frame, bp_loc, extra_args, internal_dict)
         'count_limit': flags['count_limit'],
         'hit_count': 0,
         'condition': flags['condition'],
-        'imp_addr': imp_addr
+        'imp_addr': imp_addr,
+        'triple': target.GetTriple()
     }
 
     # Print confirmation
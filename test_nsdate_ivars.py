@@ -2,78 +2,70 @@
 """
 Quick test to check if NSDate actually has ivars.
 """
+import os
 import subprocess
 import sys
+import tempfile
 
 # Create a simple LLDB script to test NSDate ivars
 lldb_script = """
 br set -n main
 run
 expr @import Foundation
-expr (void *)NSClassFromString(@"NSDate")
-expr (unsigned int *)malloc(sizeof(unsigned int))
 script
 import lldb
 frame = lldb.debugger.GetSelectedTarget().GetProcess().GetSelectedThread().GetSelectedFrame()
 
-# Get NSDate class
-class_result = frame.EvaluateExpression('(void *)NSClassFromString(@"NSDate")')
-class_ptr = class_result.GetValueAsUnsigned()
-print(f"NSDate class pointer: 0x{class_ptr:x}")
-
-# Allocate count variable
-count_result = frame.EvaluateExpression('(unsigned int *)malloc(sizeof(unsigned int))')
-count_ptr = count_result.GetValueAsUnsigned()
-print(f"Count variable: 0x{count_ptr:x}")
-
-# Get ivar list
-ivar_list_result = frame.EvaluateExpression(f'(void *)class_copyIvarList((Class)0x{class_ptr:x}, (unsigned int *)0x{count_ptr:x})')
-ivar_list_ptr = ivar_list_result.GetValueAsUnsigned()
-print(f"Ivar list pointer: 0x{ivar_list_ptr:x}")
-
-# Read count
-count_val_result = frame.EvaluateExpression(f'(unsigned int)(*(unsigned int *)0x{count_ptr:x})')
-count_val = count_val_result.GetValueAsUnsigned()
-print(f"Ivar count: {count_val}")
-
-# Check instance size
-size_result = frame.EvaluateExpression(f'(size_t)class_getInstanceSize((Class)0x{class_ptr:x})')
-size_val = size_result.GetValueAsUnsigned()
-print(f"Instance size: {size_val}")
-
-# Try with __NSDate (private subclass)
-private_result = frame.EvaluateExpression('(void *)NSClassFromString(@"__NSDate")')
-if private_result.IsValid() and not private_result.GetError().Fail():
-    private_ptr = private_result.GetValueAsUnsigned()
-    if private_ptr != 0:
-        print(f"\\n__NSDate class pointer: 0x{private_ptr:x}")
-
-        # Get ivar list for __NSDate
-        count2_result = frame.EvaluateExpression('(unsigned int *)malloc(sizeof(unsigned int))')
-        count2_ptr = count2_result.GetValueAsUnsigned()
-
-        ivar_list2_result = frame.EvaluateExpression(f'(void *)class_copyIvarList((Class)0x{private_ptr:x}, (unsigned int *)0x{count2_ptr:x})')
-        ivar_list2_ptr = ivar_list2_result.GetValueAsUnsigned()
-
-        count2_val_result = frame.EvaluateExpression(f'(unsigned int)(*(unsigned int *)0x{count2_ptr:x})')
-        count2_val = count2_val_result.GetValueAsUnsigned()
-        print(f"__NSDate ivar count: {count2_val}")
+# Probe NSDate and its private subclass __NSDate in one expression: class
+# pointer, ivar count and instance size of each. A class that does not exist
+# keeps a nil pointer, so it is reported as missing rather than as ivar-less
+info_result = frame.EvaluateExpression('''({
+    struct { Class date_cls; unsigned int date_count; size_t date_size;
+             Class private_cls; unsigned int private_count; size_t private_size; } r = {0};
+    r.date_cls = (Class)NSClassFromString(@"NSDate");
+    r.private_cls = (Class)NSClassFromString(@"__NSDate");
+    if (r.date_cls) {
+        free(class_copyIvarList(r.date_cls, &r.date_count));
+        r.date_size = class_getInstanceSize(r.date_cls);
+    }
+    if (r.private_cls) {
+        free(class_copyIvarList(r.private_cls, &r.private_count));
+        r.private_size = class_getInstanceSize(r.private_cls);
+    }
+    r;
+})''')
+if info_result.IsValid() and not info_result.GetError().Fail():
+    for label, field in (('NSDate', 'date'), ('__NSDate', 'private')):
+        class_ptr = info_result.GetChildMemberWithName(field + '_cls').GetValueAsUnsigned()
+        if class_ptr == 0:
+            print(f"{label} class not found")
+            continue
+        print(f"{label} class pointer: 0x{class_ptr:x}")
+        print(f"{label} ivar count: {info_result.GetChildMemberWithName(field + '_count').GetValueAsUnsigned()}")
+        print(f"{label} instance size: {info_result.GetChildMemberWithName(field + '_size').GetValueAsUnsigned()}")
+else:
+    print(f"Expression failed: {info_result.GetError()}")
 
 quit
 quit
 """
 
-# Write script to temp file
-with open('/tmp/test_nsdate.lldb', 'w') as f:
+# Write script to a private temp file (safe for concurrent runs)
+with tempfile.NamedTemporaryFile(mode='w', suffix='.lldb', delete=False) as f:
     f.write(lldb_script)
+    script_path = f.name
 
-# Run LLDB
-result = subprocess.run(
-    ['lldb', '/Users/alan/rc/lldb-objc/examples/HelloWorld/HelloWorld/HelloWorld', '-s', '/tmp/test_nsdate.lldb'],
-    capture_output=True,
-    text=True
-)
+try:
+    # Run LLDB, streaming its output as it arrives (stderr goes straight to ours)
+    proc = subprocess.Popen(
+        ['lldb', '/Users/alan/rc/lldb-objc/examples/HelloWorld/HelloWorld/HelloWorld', '-s', script_path],
+        stdout=subprocess.PIPE,
+        bufsize=1,
+        text=True
+    )
 
-print(result.stdout)
-if result.stderr:
-    print("STDERR:", result.stderr, file=sys.stderr)
+    for line in proc.stdout:
+        sys.stdout.write(line)
+    proc.wait()
+finally:
+    os.unlink(script_path)
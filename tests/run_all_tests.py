@@ -10,6 +10,9 @@ Usage:
     ./tests/run_all_tests.py --all        # Include future feature tests
     ./tests/run_all_tests.py --quick      # Run quick tests only (skip slow ones)
     ./tests/run_all_tests.py --verbose    # Show detailed output from each suite
+    ./tests/run_all_tests.py --jobs 4     # Run up to 4 suites in parallel
+    ./tests/run_all_tests.py --batch      # Run all suites in one Python process
+    ./tests/run_all_tests.py --cached     # Skip suites that passed with unchanged inputs
     ./tests/run_all_tests.py obrk ocls    # Run specific test suites
 """
 
@@ -18,143 +21,498 @@ import sys
 import os
 import time
 import argparse
+import collections
+import functools
+import glob
+import hashlib
+import json
 import re
+import runpy
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Get the script directory and project root
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, '..'))
+HELLO_WORLD_PATH = os.path.join(PROJECT_ROOT, 'examples/HelloWorld/HelloWorld/HelloWorld')
+
+# Per-suite time limit (seconds), and how much suite output is kept
+SUITE_TIMEOUT = 300
+OUTPUT_TAIL_LINES = 2000
+
+# Environment variable naming the JSON result file a suite writes (test_helpers)
+RESULT_FILE_ENV = 'RUN_ALL_RESULT_FILE'
+
+# Stored passing results for --cached runs
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.run_cache')
+
+# Patterns for parsing suite output (compiled once at import), and how much of
+# the output tail is searched for the summary line (it is printed last)
+_RE_ANSI = re.compile(r'\033\[[\d;]*m')
+_RE_SUMMARY = re.compile(
+    r'(?:(?P<failed>\d+)\s+failed(?:,\s+(?P<failed_passed>\d+)\s+passed)?'
+    r'|(?P<passed>\d+)\s+passed)\s+in\s+[\d.]+s'
+)
+_RE_PROGRESS = re.compile(r'([.F]+)\s+\[\s*\d+%\]')
+SUMMARY_TAIL_CHARS = 4096
+
+# Section rules in the pytest-style output (ours and the suites')
+BAR = '=' * 70
+SUBBAR = '_' * 70
+
+# Literal markers for the FAILURES section (found with str.find, no regex)
+_FAILURES_HEADER = f"{BAR}\nFAILURES\n{BAR}"
+_FAILURE_SEPARATOR = f"{SUBBAR}\n"
+
+# --batch: internal flag for the child interpreter, and its suite boundary marker
+_BATCH_WORKER_FLAG = '--batch-worker'
+_BATCH_MARKER = '##### run_all_tests batch: '
+
+# All known test suites: name -> (test file, description), in run order
+TEST_REGISTRY = {
+    'obrk': ('test_obrk.py', 'Objective-C breakpoint command'),
+    'ocls': ('test_ocls.py', 'Objective-C class finder'),
+    'osel': ('test_osel.py', 'Objective-C selector finder'),
+    'ocall': ('test_ocall.py', 'Objective-C method caller'),
+    'owatch': ('test_owatch.py', 'Objective-C method watcher'),
+    'oprotos': ('test_oprotos.py', 'Objective-C protocol conformance'),
+    'hierarchy': ('test_hierarchy.py', 'Class hierarchy display'),
+    'ivars_props': ('test_ivars_props.py', 'Instance variables and properties'),
+    'osel_perf': ('test_osel_perf.py', 'osel performance optimization'),
+    'timing': ('test_timing.py', 'Detailed timing measurements'),
+}
 
 # Test suites for implemented features
-IMPLEMENTED_TESTS = [
-    ('obrk', 'test_obrk.py', 'Objective-C breakpoint command'),
-    ('ocls', 'test_ocls.py', 'Objective-C class finder'),
-    ('osel', 'test_osel.py', 'Objective-C selector finder'),
-    ('ocall', 'test_ocall.py', 'Objective-C method caller'),
-    ('owatch', 'test_owatch.py', 'Objective-C method watcher'),
-    ('oprotos', 'test_oprotos.py', 'Objective-C protocol conformance'),
-    ('hierarchy', 'test_hierarchy.py', 'Class hierarchy display'),
-    ('ivars_props', 'test_ivars_props.py', 'Instance variables and properties'),
-    ('osel_perf', 'test_osel_perf.py', 'osel performance optimization'),
-]
+IMPLEMENTED_TESTS = (
+    'obrk', 'ocls', 'osel', 'ocall', 'owatch', 'oprotos',
+    'hierarchy', 'ivars_props', 'osel_perf',
+)
 
 # Quick tests (subset of implemented tests that run fast)
-QUICK_TESTS = [
-    ('obrk', 'test_obrk.py', 'Objective-C breakpoint command'),
-    ('hierarchy', 'test_hierarchy.py', 'Class hierarchy display'),
-    ('ivars_props', 'test_ivars_props.py', 'Instance variables and properties'),
-]
+QUICK_TESTS = ('obrk', 'hierarchy', 'ivars_props')
 
 # Tests for future/unimplemented features (in tests/future/ directory)
-FUTURE_TESTS = [
+FUTURE_TESTS = (
     # All features now implemented and moved to IMPLEMENTED_TESTS
-]
+)
 
 # Performance/timing tests (optional)
-PERF_TESTS = [
-    ('timing', 'test_timing.py', 'Detailed timing measurements'),
-]
+PERF_TESTS = ('timing',)
 
 
+def resolve_suites(names):
+    """
+    Build the run list for the given suite names.
+
+    Args:
+        names: Iterable of suite names from TEST_REGISTRY (duplicates are dropped)
+
+    Returns:
+        List of (suite_name, test_path, description) tuples, with the test
+        file path resolved once here rather than per run
+    """
+    return [(name, os.path.join(SCRIPT_DIR, TEST_REGISTRY[name][0]), TEST_REGISTRY[name][1])
+            for name in dict.fromkeys(names) if name in TEST_REGISTRY]
+
+
+@functools.lru_cache(maxsize=1)
 def check_binary():
-    """Check if HelloWorld binary exists."""
-    hello_world_path = os.path.join(PROJECT_ROOT, 'examples/HelloWorld/HelloWorld/HelloWorld')
-    if not os.path.exists(hello_world_path):
-        print("=" * 70)
+    """Check if HelloWorld binary exists (checked once per run)."""
+    if not os.path.exists(HELLO_WORLD_PATH):
+        print(BAR)
         print("SETUP ERROR")
-        print("=" * 70)
+        print(BAR)
         print(f"\nHelloWorld binary not found!")
-        print(f"  Expected: {hello_world_path}")
+        print(f"  Expected: {HELLO_WORLD_PATH}")
         print(f"  Build with: cd examples/HelloWorld && xcodebuild\n")
         return False
     return True
 
 
-def run_test_suite(test_file, verbose=False):
+def parse_suite_output(output, parse_failures=True):
+    """
+    Parse the pytest-style output of one suite.
+
+    Args:
+        output: Combined stdout/stderr of the suite
+        parse_failures: Extract the FAILURES section (skipped when the caller
+            will not report individual failures)
+
+    Returns:
+        Tuple of (passed, total, suite_failures)
+    """
+    # Parse results from output
+    # Look for pytest-style summary: "N passed in X.XXs" or "N failed, M passed in X.XXs"
+    # in the tail only (the suites colour these counts, so drop ANSI codes first)
+    passed = 0
+    total = 0
+    tail = _RE_ANSI.sub('', output[-SUMMARY_TAIL_CHARS:])
+
+    # Try to parse from summary line (the last one, if several match)
+    summary_match = None
+    for summary_match in _RE_SUMMARY.finditer(tail):
+        pass
+
+    if summary_match and summary_match.group('failed') is not None:
+        failed = int(summary_match.group('failed'))
+        passed = int(summary_match.group('failed_passed') or 0)
+        total = failed + passed
+    elif summary_match:
+        passed = int(summary_match.group('passed'))
+        total = passed
+    else:
+        # Fallback: count dots and F's from progress line
+        progress_match = _RE_PROGRESS.search(_RE_ANSI.sub('', output))
+        if progress_match:
+            progress = progress_match.group(1)
+            passed = progress.count('.')
+            total = len(progress)
+
+    # Extract failure details if present
+    failures = []
+    # Cheap substring check first - the section is absent on all-pass runs
+    if parse_failures and total > passed and 'FAILURES' in output:
+        # Extract the FAILURES section: from its header to the next bar or end
+        section_start = output.find(_FAILURES_HEADER)
+        if section_start != -1:
+            section_start += len(_FAILURES_HEADER)
+            section_end = output.find(BAR, section_start)
+            if section_end == -1:
+                section_end = len(output)
+
+            # Walk the separators in place. Each failure is printed as
+            # SEP name SEP details, with details running to the next SEP
+            sep_len = len(_FAILURE_SEPARATOR)
+            pos = output.find(_FAILURE_SEPARATOR, section_start, section_end)
+            while pos != -1:
+                name_start = pos + sep_len
+                name_end = output.find(_FAILURE_SEPARATOR, name_start, section_end)
+                if name_end == -1:
+                    name_end = section_end
+                test_name = output[name_start:name_end].strip()
+
+                if name_end == section_end:
+                    pos = -1
+                    details = ''
+                else:
+                    details_start = name_end + sep_len
+                    pos = output.find(_FAILURE_SEPARATOR, details_start, section_end)
+                    details = output[details_start:section_end if pos == -1 else pos].strip()
+
+                if test_name:
+                    failures.append({'name': test_name, 'details': details})
+
+    return passed, total, failures
+
+
+def read_result_file(result_path):
+    """
+    Read a suite result written by test_helpers.write_result_file.
+
+    Returns:
+        (passed, total, failures) tuple, or None if the suite wrote no result
+    """
+    try:
+        with open(result_path) as f:
+            suite_result = json.load(f)
+        return suite_result['passed'], suite_result['total'], suite_result['failures']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def run_test_suite(test_path, parse_failures=True):
     """
     Run a single test suite and return results.
 
+    Args:
+        test_path: Absolute path to the suite script (see resolve_suites)
+        parse_failures: Whether to extract failure details from the output
+
     Returns:
         Tuple of (passed, total, elapsed_time, output, suite_failures)
         where suite_failures is a list of detailed failure information
     """
-    test_path = os.path.join(SCRIPT_DIR, test_file)
-
     if not os.path.exists(test_path):
-        return None, None, 0, f"Test file not found: {test_file}", []
+        return None, None, 0, f"Test file not found: {os.path.basename(test_path)}", []
 
     start_time = time.time()
 
+    # test_helpers writes the suite result here as JSON (see write_result_file)
+    result_fd, result_path = tempfile.mkstemp(prefix='run_all_', suffix='.json')
+    os.close(result_fd)
+
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [sys.executable, test_path],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300,  # 5 minute timeout per suite
-            cwd=PROJECT_ROOT
+            bufsize=1,
+            cwd=PROJECT_ROOT,
+            env={**os.environ, RESULT_FILE_ENV: result_path}
         )
+        # 5 minute timeout per suite - kill the suite if it is still running
+        timer = threading.Timer(SUITE_TIMEOUT, proc.kill)
+        timer.start()
+        try:
+            # Stream lines into a bounded buffer; the summary and FAILURES
+            # section sit at the end, so only the tail is needed for parsing
+            lines = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+            line_count = 0
+            for line in proc.stdout:
+                lines.append(line)
+                line_count += 1
+            proc.wait()
+        finally:
+            timed_out = not timer.is_alive() and proc.returncode != 0
+            timer.cancel()
+            proc.stdout.close()
         elapsed = time.time() - start_time
-        output = result.stdout + result.stderr
-
-        # Parse results from output
-        # Look for pytest-style summary: "N passed in X.XXs" or "N failed, M passed in X.XXs"
-        passed = 0
-        total = 0
-
-        # Try to parse from summary line
-        summary_match = re.search(r'(\d+)\s+passed\s+in\s+[\d.]+s', output)
-        failed_match = re.search(r'(\d+)\s+failed(?:,\s+(\d+)\s+passed)?\s+in\s+[\d.]+s', output)
-
-        if failed_match:
-            failed = int(failed_match.group(1))
-            passed = int(failed_match.group(2)) if failed_match.group(2) else 0
-            total = failed + passed
-        elif summary_match:
-            passed = int(summary_match.group(1))
-            total = passed
-        else:
-            # Fallback: count dots and F's from progress line
-            progress_match = re.search(r'([.F]+)\s+\[\s*\d+%\]', output)
-            if progress_match:
-                progress = progress_match.group(1)
-                passed = progress.count('.')
-                total = len(progress)
-
-        # Extract failure details if present
-        failures = []
-        if total > passed:  # There are failures
-            # Extract the FAILURES section
-            failures_section = re.search(
-                r'={70}\nFAILURES\n={70}(.*?)(?:={70}|\Z)',
-                output,
-                re.DOTALL
-            )
-            if failures_section:
-                # Split by test separator lines
-                test_failures = re.split(r'_{70}\n', failures_section.group(1))
-                for failure in test_failures:
-                    failure = failure.strip()
-                    if failure:
-                        # Extract test name (first line) and details
-                        lines = failure.split('\n', 1)
-                        if len(lines) >= 2:
-                            test_name = lines[0].strip()
-                            details = lines[1].strip()
-                            failures.append({'name': test_name, 'details': details})
-                        elif lines:
-                            failures.append({'name': lines[0].strip(), 'details': ''})
 
+        if timed_out:
+            return 0, 1, elapsed, "TIMEOUT: Test suite exceeded 5 minute limit", [
+                {'name': 'TIMEOUT', 'details': 'Test suite exceeded 5 minute limit'}
+            ]
+
+        output = ''.join(lines)
+        if line_count > len(lines):
+            output = f"... ({line_count - len(lines)} earlier lines not kept)\n" + output
+
+        # Prefer the structured result; parse the printed output for suites
+        # that exited before writing one
+        suite_result = read_result_file(result_path)
+        if suite_result is None:
+            suite_result = parse_suite_output(output, parse_failures)
+        passed, total, failures = suite_result
         return passed, total, elapsed, output, failures
 
-    except subprocess.TimeoutExpired:
-        elapsed = time.time() - start_time
-        return 0, 1, elapsed, "TIMEOUT: Test suite exceeded 5 minute limit", [
-            {'name': 'TIMEOUT', 'details': 'Test suite exceeded 5 minute limit'}
-        ]
     except Exception as e:
         elapsed = time.time() - start_time
         return 0, 1, elapsed, f"ERROR: {str(e)}", [
             {'name': 'ERROR', 'details': str(e)}
         ]
+    finally:
+        os.unlink(result_path)
+
+
+def run_batch_worker(test_paths):
+    """
+    Run suite scripts one after another in this interpreter (--batch child).
+
+    Each suite is preceded by a marker line so the parent can split the
+    combined output, and followed by one carrying its elapsed time. Each suite
+    gets its own RUN_ALL_RESULT_FILE; the result read back from it is passed
+    on in a marker line just before the end marker.
+    """
+    for test_path in test_paths:
+        print(f"{_BATCH_MARKER}start {test_path}", flush=True)
+        start_time = time.time()
+        result_fd, result_path = tempfile.mkstemp(prefix='run_all_', suffix='.json')
+        os.close(result_fd)
+        os.environ[RESULT_FILE_ENV] = result_path
+        try:
+            runpy.run_path(test_path, run_name='__main__')
+        except SystemExit:
+            pass
+        except Exception as e:
+            print(f"ERROR: {e}")
+        finally:
+            del os.environ[RESULT_FILE_ENV]
+        suite_result = read_result_file(result_path)
+        os.unlink(result_path)
+        elapsed = time.time() - start_time
+        print()
+        if suite_result is not None:
+            print(f"{_BATCH_MARKER}result {json.dumps(suite_result)}")
+        print(f"{_BATCH_MARKER}end {elapsed:.3f}", flush=True)
+
+
+def start_batch_worker(test_paths):
+    """
+    Run a --batch worker over test_paths, applying the time limit per suite.
+
+    The SUITE_TIMEOUT timer restarts at each suite's start marker, so the
+    worker is killed as soon as any one suite overruns.
+
+    Returns:
+        Tuple of (output, timed_out, suite_start_time), where suite_start_time
+        is when the last suite the worker started began
+    """
+    proc = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), _BATCH_WORKER_FLAG, *test_paths],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        cwd=PROJECT_ROOT
+    )
+    suite_start_time = time.time()
+    timer = threading.Timer(SUITE_TIMEOUT, proc.kill)
+    timer.start()
+    lines = []
+    try:
+        for line in proc.stdout:
+            if line.startswith(_BATCH_MARKER + 'start '):
+                timer.cancel()
+                suite_start_time = time.time()
+                timer = threading.Timer(SUITE_TIMEOUT, proc.kill)
+                timer.start()
+            lines.append(line)
+        proc.wait()
+    finally:
+        timed_out = not timer.is_alive() and proc.returncode != 0
+        timer.cancel()
+        proc.stdout.close()
+    return ''.join(lines), timed_out, suite_start_time
+
+
+def run_batch(tests_to_run, parse_failures=True):
+    """
+    Run suites in a single Python subprocess and split the results.
+
+    Amortises interpreter start-up and test_helpers/pexpect imports across
+    suites; the suites within one batch run sequentially. If a suite times
+    out or the worker dies, the remaining suites continue in a fresh worker.
+
+    Args:
+        tests_to_run: List of (suite_name, test_path, description) tuples
+        parse_failures: Whether to extract failure details from the output
+
+    Returns:
+        List of run_test_suite-style tuples, in tests_to_run order
+    """
+    results = [None] * len(tests_to_run)
+    batch = []
+    for idx, (_, test_path, _) in enumerate(tests_to_run):
+        if os.path.exists(test_path):
+            batch.append(idx)
+        else:
+            results[idx] = (None, None, 0, f"Test file not found: {os.path.basename(test_path)}", [])
+
+    while batch:
+        output, timed_out, suite_start_time = start_batch_worker(
+            [tests_to_run[idx][1] for idx in batch])
+
+        # Walk the start/end markers; a suite without an end marker timed out
+        # or crashed the worker, and ends this worker's run
+        pos = 0
+        done = 0
+        for idx in batch:
+            start = output.find(_BATCH_MARKER + 'start ', pos)
+            if start == -1:
+                break
+            done += 1
+            body_start = output.find('\n', start) + 1
+            end = output.find(_BATCH_MARKER + 'end ', body_start)
+            if end == -1:
+                elapsed = time.time() - suite_start_time
+                suite_output = output[body_start:]
+                if timed_out:
+                    results[idx] = (0, 1, elapsed, suite_output or "TIMEOUT: Test suite exceeded 5 minute limit", [
+                        {'name': 'TIMEOUT', 'details': 'Test suite exceeded 5 minute limit'}
+                    ])
+                else:
+                    results[idx] = (0, 1, elapsed, suite_output or "ERROR: Batch worker exited during the suite", [
+                        {'name': 'ERROR', 'details': 'Batch worker exited during the suite'}
+                    ])
+                break
+            line_end = output.find('\n', end)
+            elapsed = float(output[end + len(_BATCH_MARKER) + 4:line_end if line_end != -1 else len(output)])
+            suite_output = output[body_start:end]
+            # Prefer the suite's structured result, as run_test_suite does
+            result_at = suite_output.rfind(_BATCH_MARKER + 'result ')
+            if result_at != -1:
+                passed, total, failures = json.loads(suite_output[result_at + len(_BATCH_MARKER) + 7:])
+                suite_output = suite_output[:result_at]
+            else:
+                passed, total, failures = parse_suite_output(suite_output, parse_failures)
+            results[idx] = (passed, total, elapsed, suite_output, failures)
+            pos = end
+
+        if done == 0:
+            # The worker failed before starting any suite; retrying won't help
+            for idx in batch:
+                results[idx] = (0, 1, 0, "ERROR: Suite did not run in batch", [
+                    {'name': 'ERROR', 'details': 'Suite did not run in batch'}
+                ])
+            break
+        batch = batch[done:]
+
+    return results
+
+
+def suite_cache_path(suite_name, test_path):
+    """
+    Path of the --cached result file for a suite.
+
+    The key covers the mtimes of the suite, the shared test helpers, the
+    HelloWorld binary and every script under test, so touching any of them
+    invalidates the stored result.
+    """
+    inputs = [test_path, os.path.join(SCRIPT_DIR, 'test_helpers.py'), HELLO_WORLD_PATH]
+    inputs.extend(sorted(glob.glob(os.path.join(PROJECT_ROOT, 'scripts', '*.py'))))
+    fingerprint = '|'.join(f"{path}:{os.path.getmtime(path) if os.path.exists(path) else 0}"
+                           for path in inputs)
+    key = hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, f"{suite_name}.{key}.json")
+
+
+def load_cached_result(cache_path):
+    """Return a stored passing result as a run_test_suite tuple, or None."""
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('status') != 'PASS':
+        return None
+    return cached['passed'], cached['total'], cached['elapsed'], "(cached result)", []
+
+
+def store_cached_result(cache_path, result):
+    """Store a passing result, replacing older entries for the same suite."""
+    passed, total, elapsed, _, _ = result
+    if passed is None or passed != total or total == 0:
+        return
+    suite_prefix = os.path.basename(cache_path).split('.', 1)[0] + '.'
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for entry in os.scandir(CACHE_DIR):
+            if entry.name.startswith(suite_prefix):
+                os.unlink(entry.path)
+        with open(cache_path, 'w') as f:
+            json.dump({'status': 'PASS', 'passed': passed, 'total': total, 'elapsed': elapsed}, f)
+    except OSError:
+        pass
+
+
+def print_progress(suite, result, completed, count, verbose):
+    """Print the progress marker (or full output when verbose) for a finished suite."""
+    suite_name, _, description = suite
+    passed, total, elapsed, output, failures = result
+
+    if verbose:
+        # In verbose mode, show the suite name and its output as it finishes
+        print(f"\n{BAR}")
+        print(f"{suite_name} :: {description}")
+        print(BAR)
+        if passed is None:
+            print(f"\nSKIPPED: {output}")
+        else:
+            print(output)
+    elif passed is None:
+        print("s", end="", flush=True)
+    elif passed == total and total > 0:
+        # Pytest-style progress indicator
+        print(".", end="", flush=True)
+    else:
+        print("F", end="", flush=True)
+
+    # Line break every 60 suites or at end
+    if not verbose and (completed % 60 == 0 or completed == count):
+        percentage = int(100 * completed / count)
+        print(f" [{percentage:3d}%]")
 
 
 def main():
@@ -167,6 +525,12 @@ def main():
                         help='Show detailed output from each test suite')
     parser.add_argument('--perf', action='store_true',
                         help='Include performance tests')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of suites to run in parallel (default: 1)')
+    parser.add_argument('--batch', action='store_true',
+                        help='Reuse one Python process per job for several suites')
+    parser.add_argument('--cached', action='store_true',
+                        help='Skip suites that passed last time with unchanged inputs')
     parser.add_argument('suites', nargs='*',
                         help='Specific test suites to run (e.g., obrk ocls)')
 
@@ -179,25 +543,23 @@ def main():
     # Determine which tests to run
     if args.suites:
         # Run specific suites
-        all_tests = IMPLEMENTED_TESTS + FUTURE_TESTS + PERF_TESTS
-        tests_to_run = [(name, file, desc) for name, file, desc in all_tests
-                        if name in args.suites]
+        tests_to_run = resolve_suites(args.suites)
         if not tests_to_run:
             print(f"\nNo matching test suites: {args.suites}")
-            print(f"Available suites: {', '.join([t[0] for t in IMPLEMENTED_TESTS + FUTURE_TESTS + PERF_TESTS])}\n")
+            print(f"Available suites: {', '.join(TEST_REGISTRY)}\n")
             sys.exit(1)
     elif args.quick:
-        tests_to_run = QUICK_TESTS
+        tests_to_run = resolve_suites(QUICK_TESTS)
     elif args.all:
-        tests_to_run = IMPLEMENTED_TESTS + FUTURE_TESTS
+        tests_to_run = resolve_suites(IMPLEMENTED_TESTS + FUTURE_TESTS)
     else:
-        tests_to_run = IMPLEMENTED_TESTS
+        tests_to_run = resolve_suites(IMPLEMENTED_TESTS)
 
     if args.perf and not args.suites:
-        tests_to_run = tests_to_run + PERF_TESTS
+        tests_to_run = tests_to_run + resolve_suites(PERF_TESTS)
 
     # Print pytest-style header
-    print("=" * 70)
+    print(BAR)
     print("test session starts")
     print(f"platform darwin -- Python {'.'.join(map(str, sys.version_info[:3]))}")
     print(f"collected {len(tests_to_run)} test suites\n")
@@ -211,21 +573,69 @@ def main():
 
     overall_start = time.time()
 
-    for idx, (suite_name, test_file, description) in enumerate(tests_to_run, 1):
-        if args.verbose:
-            # In verbose mode, show the suite name and let it print its output
-            print(f"\n{'=' * 70}")
-            print(f"{suite_name} :: {description}")
-            print("=" * 70)
-
-        passed, total, elapsed, output, failures = run_test_suite(test_file, args.verbose)
-
+    results = [None] * len(tests_to_run)
+    completed = 0
+    # Verbose runs dump each suite's output as-is and never show the parsed
+    # failure details, so don't extract them
+    parse_failures = not args.verbose
+
+    # Reuse stored passing results for suites whose inputs are unchanged
+    if args.cached:
+        for idx, (suite_name, test_path, _) in enumerate(tests_to_run):
+            results[idx] = load_cached_result(suite_cache_path(suite_name, test_path))
+            if results[idx] is not None:
+                completed += 1
+                print_progress(tests_to_run[idx], results[idx], completed,
+                               len(tests_to_run), args.verbose)
+    pending = [idx for idx, result in enumerate(results) if result is None]
+
+    if args.batch and pending:
+        # Deal the suites out to --jobs long-lived worker interpreters, each
+        # running its share in turn; report a worker's suites when it is done
+        jobs = max(1, min(args.jobs, len(pending)))
+        groups = [pending[i::jobs] for i in range(jobs)]
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(run_batch, [tests_to_run[idx] for idx in group], parse_failures): group
+                for group in groups
+            }
+
+            for future in as_completed(futures):
+                for idx, result in zip(futures[future], future.result()):
+                    results[idx] = result
+                    completed += 1
+                    print_progress(tests_to_run[idx], result, completed,
+                                   len(tests_to_run), args.verbose)
+    elif pending:
+        # Each suite is an independent subprocess (own lldb + HelloWorld), so run
+        # them on a thread pool - workers just block in subprocess.run
+        jobs = max(1, min(args.jobs, len(pending)))
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(run_test_suite, tests_to_run[idx][1], parse_failures): idx
+                for idx in pending
+            }
+
+            for future in as_completed(futures):
+                idx = futures[future]
+                results[idx] = future.result()
+                completed += 1
+                print_progress(tests_to_run[idx], results[idx], completed,
+                               len(tests_to_run), args.verbose)
+
+    # Remember passing suites for later --cached runs (only --cached runs
+    # touch the cache, so plain runs leave the tree alone)
+    if args.cached:
+        for idx in pending:
+            suite_name, test_path, _ = tests_to_run[idx]
+            store_cached_result(suite_cache_path(suite_name, test_path), results[idx])
+
+    # Merge results in the original suite order
+    for (suite_name, test_path, description), (passed, total, elapsed, output, failures) in zip(tests_to_run, results):
         if passed is None:
             # Skipped test
-            if args.verbose:
-                print(f"\nSKIPPED: {output}")
-            else:
-                print("s", end="", flush=True)
             suite_results.append({
                 'name': suite_name,
                 'status': 'SKIPPED',
@@ -234,85 +644,73 @@ def main():
                 'elapsed': elapsed,
                 'failures': []
             })
-        else:
-            if args.verbose:
-                # Print the actual suite output
-                print(output)
-            else:
-                # Pytest-style progress indicator
-                if passed == total and total > 0:
-                    print(".", end="", flush=True)
-                else:
-                    print("F", end="", flush=True)
-                    failed_suites.append({
-                        'name': suite_name,
-                        'description': description,
-                        'passed': passed,
-                        'total': total,
-                        'elapsed': elapsed,
-                        'failures': failures,
-                        'output': output
-                    })
+            continue
 
-            suite_results.append({
+        if not args.verbose and not (passed == total and total > 0):
+            failed_suites.append({
                 'name': suite_name,
-                'status': 'PASS' if passed == total and total > 0 else 'FAIL',
+                'file': os.path.basename(test_path),
+                'description': description,
                 'passed': passed,
                 'total': total,
                 'elapsed': elapsed,
-                'failures': failures
+                'failures': failures,
+                'output': output
             })
 
-            total_passed += passed
-            total_tests += total
-            total_time += elapsed
+        suite_results.append({
+            'name': suite_name,
+            'status': 'PASS' if passed == total and total > 0 else 'FAIL',
+            'passed': passed,
+            'total': total,
+            'elapsed': elapsed,
+            'failures': failures
+        })
 
-        # Line break every 60 suites or at end
-        if not args.verbose and (idx % 60 == 0 or idx == len(tests_to_run)):
-            percentage = int(100 * idx / len(tests_to_run))
-            print(f" [{percentage:3d}%]")
+        total_passed += passed
+        total_tests += total
+        total_time += elapsed
 
     overall_elapsed = time.time() - overall_start
 
-    # Print failures section (pytest style) - only if not in verbose mode
+    # Print failures section (pytest style) - only if not in verbose mode.
+    # Built up in one list and written once rather than print() per line
     if not args.verbose and failed_suites:
-        print(f"\n{'=' * 70}")
-        print("FAILURES")
-        print("=" * 70)
+        parts = [f"\n{BAR}\nFAILURES\n{BAR}\n"]
 
         for suite in failed_suites:
-            print(f"\n{'_' * 70}")
-            print(f"{suite['name']} :: {suite['description']}")
-            print(f"Result: {suite['passed']}/{suite['total']} passed ({suite['elapsed']:.2f}s)")
-            print("_" * 70)
+            parts.append(f"\n{SUBBAR}\n"
+                         f"{suite['name']} :: {suite['description']}\n"
+                         f"Result: {suite['passed']}/{suite['total']} passed ({suite['elapsed']:.2f}s)\n"
+                         f"{SUBBAR}\n")
 
             if suite['failures']:
                 for failure in suite['failures'][:5]:  # Show first 5 failures
-                    print(f"\n  {failure['name']}")
-                    # Show first 300 chars of details
+                    parts.append(f"\n  {failure['name']}\n")
+                    # Show first 300 chars of details, indented
                     details = failure['details'][:300]
-                    if details:
-                        # Indent the details
-                        for line in details.split('\n'):
-                            if line.strip():
-                                print(f"    {line}")
+                    for line in details.split('\n'):
+                        if line.strip():
+                            parts.append(f"    {line}\n")
                     if len(failure['details']) > 300:
-                        print(f"    ... ({len(failure['details']) - 300} more characters)")
+                        parts.append(f"    ... ({len(failure['details']) - 300} more characters)\n")
 
                 if len(suite['failures']) > 5:
-                    print(f"\n  ... and {len(suite['failures']) - 5} more failures")
+                    parts.append(f"\n  ... and {len(suite['failures']) - 5} more failures\n")
 
-            # Show how to re-run this specific suite
-            print(f"\n  Re-run this suite: ./tests/{suite['name'] if suite['name'].startswith('test_') else 'test_' + suite['name'] + '.py'}")
-            if not suite['name'].startswith('test_'):
-                print(f"  Re-run this suite: python3 tests/test_{suite['name']}.py")
+            # Show how to re-run this specific suite (its actual script)
+            parts.append(f"\n  Re-run this suite: ./tests/{suite['file']}\n")
 
-    # Print summary section (pytest style)
-    print(f"\n{'=' * 70}")
+        sys.stdout.write("".join(parts))
 
-    suites_passed = sum(1 for r in suite_results if r['status'] == 'PASS')
-    suites_failed = sum(1 for r in suite_results if r['status'] == 'FAIL')
-    suites_skipped = sum(1 for r in suite_results if r['status'] == 'SKIPPED')
+    status_counts = collections.Counter(r['status'] for r in suite_results)
+    suites_passed = status_counts['PASS']
+    suites_failed = status_counts['FAIL']
+    suites_skipped = status_counts['SKIPPED']
+    failed_tests = total_tests - total_passed
+
+    # Print summary section (pytest style)
+    parts = [f"\n{BAR}\n"]
 
     if not args.verbose:
         # Show suite-level summary
@@ -324,29 +722,32 @@ def main():
         if suites_skipped > 0:
             summary_parts.append(f"{suites_skipped} skipped")
 
-        print(f"{', '.join(summary_parts)} in {overall_elapsed:.2f}s")
+        parts.append(f"{', '.join(summary_parts)} in {overall_elapsed:.2f}s\n")
 
         # Show test-level summary underneath
         if total_tests > 0:
             test_summary_parts = []
-            failed_tests = total_tests - total_passed
             if failed_tests > 0:
                 test_summary_parts.append(f"{failed_tests} failed")
             if total_passed > 0:
                 test_summary_parts.append(f"{total_passed} passed")
-            print(f"({', '.join(test_summary_parts)} tests total)")
+            parts.append(f"({', '.join(test_summary_parts)} tests total)\n")
     else:
         # In verbose mode, just show overall summary
         if suites_failed == 0:
-            print(f"\033[92mAll {suites_passed} suites passed\033[0m ({total_passed} tests) in {overall_elapsed:.2f}s")
+            parts.append(f"\033[92mAll {suites_passed} suites passed\033[0m ({total_passed} tests) in {overall_elapsed:.2f}s\n")
         else:
-            print(f"\033[91m{suites_failed} of {len(suite_results)} suites failed\033[0m in {overall_elapsed:.2f}s")
+            parts.append(f"\033[91m{suites_failed} of {len(suite_results)} suites failed\033[0m in {overall_elapsed:.2f}s\n")
 
-    print("=" * 70)
+    parts.append(f"{BAR}\n")
+    sys.stdout.write("".join(parts))
 
     # Exit with appropriate code
     sys.exit(0 if suites_failed == 0 else 1)
 
 
 if __name__ == '__main__':
-    main()
+    if sys.argv[1:2] == [_BATCH_WORKER_FLAG]:
+        run_batch_worker(sys.argv[2:])
+    else:
+        main()
@@ -13,6 +13,7 @@ Provides common utilities for:
 """
 
 import subprocess
+import json
 import os
 import re
 import time
@@ -27,6 +28,17 @@ HELLO_WORLD_PATH = os.path.join(PROJECT_ROOT, 'examples/HelloWorld/HelloWorld/He
 # Test timeout in seconds (1 minute max per test case)
 TEST_TIMEOUT_SECONDS = 60
 
+# Set by run_all_tests.py: file to receive a JSON copy of the suite result
+RESULT_FILE_ENV = 'RUN_ALL_RESULT_FILE'
+
+# Section separators in the pytest-style suite output (run_all_tests.py
+# splits failure reports on these)
+BAR = '=' * 70
+SUBBAR = '_' * 70
+
+# Error keyword in LLDB/command output, in any case ("error:", "Error", "ERROR")
+ERROR_RE = re.compile(r'error', re.IGNORECASE)
+
 
 class TestTimeoutError(Exception):
     """Raised when a test exceeds the timeout limit."""
@@ -206,6 +218,36 @@ def parse_timing_metrics(output):
     return metrics
 
 
+def write_result_file(results):
+    """
+    Write the suite result as JSON for run_all_tests.py, if it asked for one.
+
+    Lets the runner read passed/total/failures directly instead of parsing
+    the printed summary. Does nothing when RUN_ALL_RESULT_FILE is unset.
+
+    Args:
+        results: List of TestResult objects for the suite
+    """
+    result_path = os.environ.get(RESULT_FILE_ENV)
+    if not result_path:
+        return
+
+    failures = []
+    for result in results:
+        if not result.passed:
+            details = result.message
+            if result.failure_detail:
+                details += f"\n\n  Output (first 500 chars):\n  {result.failure_detail[:500]}"
+            failures.append({'name': result.name, 'details': details})
+
+    with open(result_path, 'w') as f:
+        json.dump({
+            'passed': sum(1 for r in results if r.passed),
+            'total': len(results),
+            'failures': failures,
+        }, f)
+
+
 def run_test_suite(name, tests, show_category_summary=None):
     """
     Run a list of test functions and print results.
@@ -221,9 +263,9 @@ def run_test_suite(name, tests, show_category_summary=None):
     Returns:
         (passed_count, total_count)
     """
-    print("=" * 70)
+    print(BAR)
     print(name)
-    print("=" * 70)
+    print(BAR)
     print(f"Binary: {HELLO_WORLD_PATH}")
     print(f"Timeout: {TEST_TIMEOUT_SECONDS}s per test")
 
@@ -269,6 +311,7 @@ def run_test_suite(name, tests, show_category_summary=None):
     total = len(results)
     print(f"\nTotal: {passed}/{total} passed in {suite_elapsed:.1f}s")
 
+    write_result_file(results)
     return passed, total
 
 
@@ -583,7 +626,7 @@ def run_shared_test_suite(name, test_specs, scripts=None, show_category_summary=
     suite_start_time = time.time()
 
     # Print header in pytest style
-    print(f"{'=' * 70}")
+    print(BAR)
     print(f"test session starts")
     print(f"platform darwin -- Python {'.'.join(map(str, __import__('sys').version_info[:3]))}")
     print(f"collected {len(test_specs)} items\n")
@@ -647,14 +690,14 @@ def run_shared_test_suite(name, test_specs, scripts=None, show_category_summary=
 
     # Print failures section (pytest style)
     if failures:
-        print(f"\n{'=' * 70}")
+        print(f"\n{BAR}")
         print("FAILURES")
-        print(f"{'=' * 70}")
+        print(BAR)
 
         for test_idx, result, output in failures:
-            print(f"\n{'_' * 70}")
+            print(f"\n{SUBBAR}")
             print(f"{result.name}")
-            print(f"{'_' * 70}\n")
+            print(f"{SUBBAR}\n")
 
             # Show the failure message
             print(result.message)
@@ -671,7 +714,7 @@ def run_shared_test_suite(name, test_specs, scripts=None, show_category_summary=
     total = len(results)
     failed = total - passed
 
-    print(f"\n{'=' * 70}")
+    print(f"\n{BAR}")
 
     if failed == 0:
         print(f"\033[92m{passed} passed\033[0m in {suite_elapsed:.2f}s")
@@ -683,8 +726,9 @@ def run_shared_test_suite(name, test_specs, scripts=None, show_category_summary=
             parts.append(f"\033[92m{passed} passed\033[0m")
         print(f"{', '.join(parts)} in {suite_elapsed:.2f}s")
 
-    print(f"{'=' * 70}")
+    print(BAR)
 
+    write_result_file(results)
     return passed, total
 
 
@@ -692,6 +736,24 @@ def run_shared_test_suite(name, test_specs, scripts=None, show_category_summary=
 # Consolidated Validator Utilities
 # =============================================================================
 
+def failure(output, summary, *details, preview=300):
+    """
+    Build a failed validator result with an output preview.
+
+    Args:
+        output: The command output being validated
+        summary: First line of the failure message
+        *details: Further message lines, indented under the summary
+        preview: Number of output characters to include
+
+    Returns:
+        (False, message) validator result
+    """
+    lines = [summary] + [f"    {line}" for line in details]
+    lines.append(f"    Output preview: {output[:preview]}")
+    return False, "\n".join(lines)
+
+
 class Validators:
     """Consolidated validator factory to reduce duplication across test files."""
 
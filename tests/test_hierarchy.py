@@ -16,6 +16,9 @@ from test_helpers import (
     TestResult, check_hello_world_binary, run_shared_test_suite
 )
 
+# Match count line printed by ocls ("Found N ...")
+_RE_FOUND = re.compile(r'Found (\d+)')
+
 
 # =============================================================================
 # Validator Functions
@@ -61,7 +64,7 @@ def validate_few_matches():
     """Validator for 2-20 matches hierarchy display."""
     def validator(output):
         # Parse match count
-        match = re.search(r'Found (\d+)', output)
+        match = _RE_FOUND.search(output)
         if match:
             count = int(match.group(1))
             has_hierarchy = '→' in output
@@ -91,18 +94,19 @@ def validate_each_class_hierarchy():
     """Validator for each class in 2-20 range showing hierarchy."""
     def validator(output):
         # Parse match count
-        match = re.search(r'Found (\d+)', output)
+        match = _RE_FOUND.search(output)
         if match:
             count = int(match.group(1))
             if 2 <= count <= 20:
                 # Count how many lines have hierarchy arrows (excluding summary line)
-                lines = output.split('\n')
-                hierarchy_lines = [l for l in lines if '→' in l and 'total' not in l.lower()]
-
-                if len(hierarchy_lines) >= count:
-                    return True, f"All {count} classes show hierarchy ({len(hierarchy_lines)} hierarchy lines)"
-                elif len(hierarchy_lines) > 0:
-                    return True, f"{len(hierarchy_lines)}/{count} classes show hierarchy"
+                hierarchy_lines = (sum(1 for l in output.splitlines()
+                                       if '→' in l and 'total' not in l.lower())
+                                   if '→' in output else 0)
+
+                if hierarchy_lines >= count:
+                    return True, f"All {count} classes show hierarchy ({hierarchy_lines} hierarchy lines)"
+                elif hierarchy_lines > 0:
+                    return True, f"{hierarchy_lines}/{count} classes show hierarchy"
                 return False, (f"No hierarchy lines found for {count} matches\n"
                               f"    Expected: At least some classes with '→' hierarchy arrows\n"
                               f"    Actual: No hierarchy lines detected\n"
@@ -120,21 +124,22 @@ def validate_many_matches():
     """Validator for 21+ matches (no per-class hierarchy)."""
     def validator(output):
         # Parse match count
-        match = re.search(r'Found (\d+)', output)
+        match = _RE_FOUND.search(output)
         if match:
             count = int(match.group(1))
             if count > 20:
                 # Count lines that look like class listings with hierarchy
-                lines = output.split('\n')
-                hierarchy_lines = [l for l in lines if l.strip().startswith('NS') and '→' in l]
+                hierarchy_lines = (sum(1 for l in output.splitlines()
+                                       if '→' in l and l.lstrip().startswith('NS'))
+                                   if '→' in output else 0)
 
-                if len(hierarchy_lines) == 0:
+                if hierarchy_lines == 0:
                     return True, f"No per-class hierarchy for {count} matches (>20)"
-                elif len(hierarchy_lines) < count // 2:
-                    return True, f"Minimal hierarchy for {count} matches ({len(hierarchy_lines)} with arrows)"
-                return False, (f"Too many hierarchy lines ({len(hierarchy_lines)}) for {count} matches\n"
+                elif hierarchy_lines < count // 2:
+                    return True, f"Minimal hierarchy for {count} matches ({hierarchy_lines} with arrows)"
+                return False, (f"Too many hierarchy lines ({hierarchy_lines}) for {count} matches\n"
                               f"    Expected: Simple list without per-class hierarchy for >20 matches\n"
-                              f"    Actual: Found {len(hierarchy_lines)} hierarchy lines\n"
+                              f"    Actual: Found {hierarchy_lines} hierarchy lines\n"
                               f"    Threshold: Should be < {count // 2}\n"
                               f"    Output preview: {output[:250]}")
             return False, (f"Expected >20 matches, got {count}\n"
@@ -151,7 +156,7 @@ def validate_many_matches():
 def validate_threshold_boundary():
     """Validator for 20-class threshold boundary."""
     def validator(output):
-        match = re.search(r'Found (\d+)', output)
+        match = _RE_FOUND.search(output)
         if match:
             count = int(match.group(1))
             has_hierarchy = '→' in output
@@ -186,6 +191,16 @@ def validate_root_class():
     return validator
 
 
+# Validators hold no per-test state, so each is built once at import
+VALIDATE_SINGLE_MATCH = validate_single_match()
+VALIDATE_INHERITANCE_CHAIN = validate_inheritance_chain()
+VALIDATE_FEW_MATCHES = validate_few_matches()
+VALIDATE_EACH_CLASS_HIERARCHY = validate_each_class_hierarchy()
+VALIDATE_MANY_MATCHES = validate_many_matches()
+VALIDATE_THRESHOLD_BOUNDARY = validate_threshold_boundary()
+VALIDATE_ROOT_CLASS = validate_root_class()
+
+
 # =============================================================================
 # Test Specifications
 # =============================================================================
@@ -197,40 +212,40 @@ def get_test_specs():
         (
             "Single Match (NSString)",
             ['ocls NSString'],
-            validate_single_match()
+            VALIDATE_SINGLE_MATCH
         ),
         (
             "Inheritance chain: NSMutableString",
             ['ocls NSMutableString'],
-            validate_inheritance_chain()
+            VALIDATE_INHERITANCE_CHAIN
         ),
         # Few matches (2-20) tests
         (
             "Few Matches (NSMutable*)",
             ['ocls NSMutable*'],
-            validate_few_matches()
+            VALIDATE_FEW_MATCHES
         ),
         (
             "Each class shows hierarchy (2-20)",
             ['ocls NSMutableS*'],
-            validate_each_class_hierarchy()
+            VALIDATE_EACH_CLASS_HIERARCHY
         ),
         # Many matches (21+) tests
         (
             "Many Matches (NS*) - no per-class hierarchy",
             ['ocls NS*'],
-            validate_many_matches()
+            VALIDATE_MANY_MATCHES
         ),
         # Edge cases
         (
             "Threshold boundary: exactly 20 matches",
             ['ocls NSMutable*'],
-            validate_threshold_boundary()
+            VALIDATE_THRESHOLD_BOUNDARY
         ),
         (
             "Root class: NSObject",
             ['ocls NSObject'],
-            validate_root_class()
+            VALIDATE_ROOT_CLASS
         ),
     ]
 
@@ -14,532 +14,521 @@ Uses a shared LLDB session for faster test execution.
 import sys
 import re
 import os
+from functools import partial
 from test_helpers import (
-    TestResult, check_hello_world_binary, run_shared_test_suite,
-    PROJECT_ROOT
+    TestResult, check_hello_world_binary, run_shared_test_suite, failure,
+    ERROR_RE, PROJECT_ROOT
 )
 
+# Script under test, relative to PROJECT_ROOT (as passed to the LLDB session)
+_OBJC_CALL_SCRIPT = 'scripts/objc_call.py'
+_OBJC_CALL_PATH = os.path.join(PROJECT_ROOT, _OBJC_CALL_SCRIPT)
+
+# Output patterns (compiled once at import)
+# A YYYY-MM-DD date or HH:MM:SS time, as in an NSDate description
+_DATE_OR_TIME = r'\d{4}-\d{2}-\d{2}|\d{2}:\d{2}:\d{2}'
+_DATE_OR_NSDATE_RE = re.compile(_DATE_OR_TIME + r'|NSDate')
+_DATE_ONLY_RE = re.compile(_DATE_OR_TIME)
+_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+_VAR_ADDRESS_RE = re.compile(r'\$\d+\s*=\s*(0x[0-9a-fA-F]+)')
+_VAR_RE = re.compile(r'\$\d+\s*=')
+# Error keywords, each set matched case-insensitively in a single pass
+_ERR_INVALID_CLASS_RE = re.compile(r'not found|error|failed', re.IGNORECASE)
+_ERR_SYNTAX_RE = re.compile(r'usage|syntax|error', re.IGNORECASE)
+_ERR_FAILED_RE = re.compile(r'error|failed', re.IGNORECASE)
+_NOT_IMPLEMENTED_RE = re.compile(r'not implemented', re.IGNORECASE)
+_NOT_FOUND_RE = re.compile(r'not found', re.IGNORECASE)
+_PARSE_ERROR_RE = re.compile(r'parse|syntax', re.IGNORECASE)
+# Other case-insensitive markers
+_REGISTER_RE = re.compile(r'description|register', re.IGNORECASE)
+_RESOLVE_RE = re.compile(r'resolve', re.IGNORECASE)
+_ARRAY_ITEM_RES = (re.compile(r'one', re.IGNORECASE), re.compile(r'two', re.IGNORECASE))
+_DICT_ITEM_RES = (re.compile(r'key', re.IGNORECASE), re.compile(r'value', re.IGNORECASE))
+
+
+def _check_any_token(output, tokens, success, missing, error=None,
+                     error_re=_ERR_FAILED_RE, error_unless=None, preview=300):
+    """
+    Shared validator for ocall results recognised by a literal token.
+
+    Passes when any of tokens is in the output. Otherwise error and missing
+    are (summary, *details) failure messages: error when error_re matches
+    (and error_unless, if given, does not), missing for anything else.
+    """
+    if any(token in output for token in tokens):
+        return True, success
+    elif (error is not None and error_re.search(output)
+          and (error_unless is None or not error_unless.search(output))):
+        return failure(output, *error, preview=preview)
+    return failure(output, *missing, preview=preview)
+
 
 # =============================================================================
 # Validator Functions
 # =============================================================================
 
-def validate_class_method_basic():
+def validate_class_method_basic(output):
     """Validator for basic class method call."""
-    def validator(output):
-        # NSDate date returns a date representation
-        if re.search(r'\d{4}-\d{2}-\d{2}|\d{2}:\d{2}:\d{2}|NSDate', output):
-            return True, "Returned date value"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"Command failed\n"
-                          f"    Expected: Date representation (YYYY-MM-DD or HH:MM:SS)\n"
-                          f"    Actual: Error or failure encountered\n"
-                          f"    Output preview: {output[:200]}")
-        return False, (f"Unexpected output\n"
-                      f"    Expected: Date format or 'NSDate' in output\n"
-                      f"    Actual: No date representation found\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_class_method_with_arg():
-    """Validator for class method with string argument."""
-    def validator(output):
-        if 'hello' in output:
-            return True, "Returned string value"
-        elif 'error' in output.lower() and 'not implemented' not in output.lower():
-            return False, (f"Command failed\n"
-                          f"    Expected: String 'hello' in output\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:200]}")
-        return False, (f"String not found in output\n"
-                      f"    Expected: 'hello' in returned string\n"
-                      f"    Actual: String not present\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_instance_method_from_variable():
-    """Validator for instance method using $variable."""
-    def validator(output):
-        if 'TestString' in output:
-            return True, "Returned instance description"
-        elif 'error' in output.lower() and 'not implemented' not in output.lower():
-            return False, (f"Command failed\n"
-                          f"    Expected: 'TestString' in output\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:200]}")
-        return False, (f"Instance description not found\n"
-                      f"    Expected: 'TestString' from $testStr description\n"
-                      f"    Actual: String not present in output\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_instance_method_from_register():
+    # NSDate date returns a date representation
+    if _DATE_OR_NSDATE_RE.search(output):
+        return True, "Returned date value"
+    elif _ERR_FAILED_RE.search(output):
+        return failure(output, "Command failed",
+                       "Expected: Date representation (YYYY-MM-DD or HH:MM:SS)",
+                       "Actual: Error or failure encountered",
+                       preview=200)
+    return failure(output, "Unexpected output",
+                   "Expected: Date format or 'NSDate' in output",
+                   "Actual: No date representation found",
+                   preview=200)
+
+
+# Class method with string argument
+validate_class_method_with_arg = partial(
+    _check_any_token,
+    tokens=('hello',),
+    success="Returned string value",
+    error=("Command failed",
+           "Expected: String 'hello' in output",
+           "Actual: Error encountered"),
+    error_re=ERROR_RE,
+    error_unless=_NOT_IMPLEMENTED_RE,
+    missing=("String not found in output",
+             "Expected: 'hello' in returned string",
+             "Actual: String not present"),
+    preview=200)
+
+
+# Instance method using $variable
+validate_instance_method_from_variable = partial(
+    _check_any_token,
+    tokens=('TestString',),
+    success="Returned instance description",
+    error=("Command failed",
+           "Expected: 'TestString' in output",
+           "Actual: Error encountered"),
+    error_re=ERROR_RE,
+    error_unless=_NOT_IMPLEMENTED_RE,
+    missing=("Instance description not found",
+             "Expected: 'TestString' from $testStr description",
+             "Actual: String not present in output"),
+    preview=200)
+
+
+def validate_instance_method_from_register(output):
     """Validator for instance method using register."""
-    def validator(output):
-        # Register-based calls depend on runtime state, so be lenient
-        if 'description' in output.lower() or '$x0' in output or 'register' in output.lower():
-            return True, "Register syntax handled"
-        elif 'parse' in output.lower() or 'syntax' in output.lower():
-            return False, (f"Failed to parse register syntax\n"
-                          f"    Expected: Register syntax like '$x0' to be accepted\n"
-                          f"    Actual: Parse or syntax error\n"
-                          f"    Output preview: {output[:200]}")
-        # If it executed without syntax error, that's acceptable
-        return True, "Command executed (result depends on register state)"
-    return validator
-
-
-def validate_verbose_mode():
+    # Register-based calls depend on runtime state, so be lenient
+    if '$x0' in output or _REGISTER_RE.search(output):
+        return True, "Register syntax handled"
+    elif _PARSE_ERROR_RE.search(output):
+        return failure(output, "Failed to parse register syntax",
+                       "Expected: Register syntax like '$x0' to be accepted",
+                       "Actual: Parse or syntax error",
+                       preview=200)
+    # If it executed without syntax error, that's acceptable
+    return True, "Command executed (result depends on register state)"
+
+
+def validate_verbose_mode(output):
     """Validator for verbose mode output."""
-    def validator(output):
-        if 'Class' in output or 'SEL' in output or 'resolve' in output.lower():
-            return True, "Shows resolution details"
-        elif re.search(r'\d{4}-\d{2}-\d{2}|\d{2}:\d{2}:\d{2}', output):
-            return False, (f"Got result but no verbose output\n"
-                          f"    Expected: Resolution details ('Class', 'SEL', or 'resolve')\n"
-                          f"    Actual: Result returned but no verbose information\n"
-                          f"    Output preview: {output[:200]}")
-        return False, (f"No resolution info\n"
-                      f"    Expected: Verbose output with 'Class', 'SEL', or resolution info\n"
-                      f"    Actual: No resolution details found\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_private_class():
+    if 'Class' in output or 'SEL' in output or _RESOLVE_RE.search(output):
+        return True, "Shows resolution details"
+    elif _DATE_ONLY_RE.search(output):
+        return failure(output, "Got result but no verbose output",
+                       "Expected: Resolution details ('Class', 'SEL', or 'resolve')",
+                       "Actual: Result returned but no verbose information",
+                       preview=200)
+    return failure(output, "No resolution info",
+                   "Expected: Verbose output with 'Class', 'SEL', or resolution info",
+                   "Actual: No resolution details found",
+                   preview=200)
+
+
+def validate_private_class(output):
     """Validator for private class method call."""
-    def validator(output):
-        if 'IDSService' in output or '0x' in output:
-            return True, "Resolved private class"
-        elif 'not found' in output.lower():
-            return False, (f"Private class not found (framework may not be loaded)\n"
-                          f"    Expected: IDSService class to be callable\n"
-                          f"    Actual: Class not found\n"
-                          f"    Possible cause: IDS framework not loaded via dlopen\n"
-                          f"    Output preview: {output[:200]}")
-        return False, (f"Unexpected output for private class\n"
-                      f"    Expected: 'IDSService' or hex address in output\n"
-                      f"    Actual: Neither found\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_invalid_class():
+    if 'IDSService' in output or '0x' in output:
+        return True, "Resolved private class"
+    elif _NOT_FOUND_RE.search(output):
+        return failure(output, "Private class not found (framework may not be loaded)",
+                       "Expected: IDSService class to be callable",
+                       "Actual: Class not found",
+                       "Possible cause: IDS framework not loaded via dlopen",
+                       preview=200)
+    return failure(output, "Unexpected output for private class",
+                   "Expected: 'IDSService' or hex address in output",
+                   "Actual: Neither found",
+                   preview=200)
+
+
+def validate_invalid_class(output):
     """Validator for non-existent class error."""
-    def validator(output):
-        if 'not found' in output.lower() or 'error' in output.lower() or 'failed' in output.lower():
-            return True, "Properly reports error for invalid class"
-        return False, (f"Should report error for invalid class\n"
-                      f"    Expected: 'not found', 'error', or 'failed' message\n"
-                      f"    Actual: No error message found\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
+    if _ERR_INVALID_CLASS_RE.search(output):
+        return True, "Properly reports error for invalid class"
+    return failure(output, "Should report error for invalid class",
+                   "Expected: 'not found', 'error', or 'failed' message",
+                   "Actual: No error message found",
+                   preview=200)
 
 
-def validate_invalid_syntax():
+def validate_invalid_syntax(output):
     """Validator for syntax errors."""
-    def validator(output):
-        if 'usage' in output.lower() or 'syntax' in output.lower() or 'error' in output.lower():
-            return True, "Properly reports syntax error"
-        return False, (f"Should report syntax error\n"
-                      f"    Expected: 'usage', 'syntax', or 'error' message\n"
-                      f"    Actual: No error message found\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_return_value():
-    """Validator for return value display."""
-    def validator(output):
-        if '42' in output:
-            return True, "Shows return value"
-        return False, (f"Return value not visible\n"
-                      f"    Expected: '42' in output from numberWithInt:42\n"
-                      f"    Actual: Value not found\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_address_prefix():
+    if _ERR_SYNTAX_RE.search(output):
+        return True, "Properly reports syntax error"
+    return failure(output, "Should report syntax error",
+                   "Expected: 'usage', 'syntax', or 'error' message",
+                   "Actual: No error message found",
+                   preview=200)
+
+
+# Return value display
+validate_return_value = partial(
+    _check_any_token,
+    tokens=('42',),
+    success="Shows return value",
+    missing=("Return value not visible",
+             "Expected: '42' in output from numberWithInt:42",
+             "Actual: Value not found"),
+    preview=200)
+
+
+def validate_address_prefix(output):
     """Validator for address prefix in output with variable name."""
-    def validator(output):
-        # Look for the call-style format: (Type *) $N = 0x...
-        # Pattern: ($N) followed by = and hex address
-        var_match = re.search(r'\$\d+\s*=\s*(0x[0-9a-fA-F]+)', output, re.MULTILINE)
-        if not var_match:
-            return False, (f"No variable assignment with address found\n"
-                          f"    Expected: Output like '(Type) $N = 0x...' format\n"
-                          f"    Actual: No matching pattern found\n"
-                          f"    Output preview: {output[:300]}")
-        return True, f"Found variable with address: {var_match.group(1)}"
-    return validator
-
-
-def validate_address_matches_po():
+    # Look for the call-style format: (Type *) $N = 0x...
+    # Pattern: ($N) followed by = and hex address
+    var_match = _VAR_ADDRESS_RE.search(output)
+    if not var_match:
+        return failure(output, "No variable assignment with address found",
+                       "Expected: Output like '(Type) $N = 0x...' format",
+                       "Actual: No matching pattern found")
+    return True, f"Found variable with address: {var_match.group(1)}"
+
+
+def validate_address_matches_po(output):
     """Validator that extracts address from ocall output and verifies it matches po output."""
-    def validator(output):
-        # The output contains both the ocall result and the po result
-        # Look for the call-style format: (Type *) $N = 0x...
-        var_match = re.search(r'\$\d+\s*=\s*(0x[0-9a-fA-F]+)', output, re.MULTILINE)
-        if not var_match:
-            return False, (f"No variable assignment with address found\n"
-                          f"    Expected: Output like '(Type) $N = 0x...' format\n"
-                          f"    Actual: No matching pattern found\n"
-                          f"    Output preview: {output[:300]}")
-
-        address = var_match.group(1)
-
-        # Look for a date pattern in the output - it should appear in both ocall and po results
-        # The date format from NSDate is like: 2025-12-29 21:46:51 +0000
-        date_pattern = r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'
-        date_matches = re.findall(date_pattern, output)
-
-        if len(date_matches) < 2:
-            return False, (f"Expected two date representations (ocall and po)\n"
-                          f"    Found: {len(date_matches)} date(s)\n"
-                          f"    Address: {address}\n"
-                          f"    Output preview: {output[:400]}")
-
-        # Both dates should match (they're the same object)
-        if date_matches[0] == date_matches[1]:
-            return True, f"Address {address} verified: both show '{date_matches[0]}'"
-
-        return False, (f"Date mismatch between ocall and po\n"
-                      f"    ocall date: {date_matches[0]}\n"
-                      f"    po date: {date_matches[1]}\n"
-                      f"    Address: {address}")
-    return validator
-
-
-def validate_auto_detect_class_method():
+    # The output contains both the ocall result and the po result
+    # Look for the call-style format: (Type *) $N = 0x...
+    var_match = _VAR_ADDRESS_RE.search(output)
+    if not var_match:
+        return failure(output, "No variable assignment with address found",
+                       "Expected: Output like '(Type) $N = 0x...' format",
+                       "Actual: No matching pattern found")
+
+    address = var_match.group(1)
+
+    # Look for a date pattern in the output - it should appear in both ocall and po results
+    # The date format from NSDate is like: 2025-12-29 21:46:51 +0000
+    date_matches = _DATETIME_RE.findall(output)
+
+    if len(date_matches) < 2:
+        return failure(output, "Expected two date representations (ocall and po)",
+                       f"Found: {len(date_matches)} date(s)",
+                       f"Address: {address}",
+                       preview=400)
+
+    # Both dates should match (they're the same object)
+    if date_matches[0] == date_matches[1]:
+        return True, f"Address {address} verified: both show '{date_matches[0]}'"
+
+    return False, (f"Date mismatch between ocall and po\n"
+                  f"    ocall date: {date_matches[0]}\n"
+                  f"    po date: {date_matches[1]}\n"
+                  f"    Address: {address}")
+
+
+def validate_auto_detect_class_method(output):
     """Validator for auto-detect class method (without + prefix)."""
-    def validator(output):
-        # Should return a date just like +[NSDate date]
-        if re.search(r'\d{4}-\d{2}-\d{2}|\d{2}:\d{2}:\d{2}|NSDate', output):
-            return True, "Auto-detected class method returned date"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"Auto-detect failed\n"
-                          f"    Expected: Date representation\n"
-                          f"    Actual: Error or failure\n"
-                          f"    Output preview: {output[:200]}")
-        return False, (f"Unexpected output\n"
-                      f"    Expected: Date format from [NSDate date]\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_auto_detect_instance_method():
-    """Validator for auto-detect instance method on variable."""
-    def validator(output):
-        if 'AutoDetectTest' in output:
-            return True, "Auto-detected instance method returned description"
-        elif 'error' in output.lower():
-            return False, (f"Auto-detect instance method failed\n"
-                          f"    Expected: 'AutoDetectTest' in output\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:200]}")
-        return False, (f"Instance description not found\n"
-                      f"    Expected: 'AutoDetectTest' from description\n"
-                      f"    Output preview: {output[:200]}")
-    return validator
-
-
-def validate_variable_name_in_output():
+    # Should return a date just like +[NSDate date]
+    if _DATE_OR_NSDATE_RE.search(output):
+        return True, "Auto-detected class method returned date"
+    elif _ERR_FAILED_RE.search(output):
+        return failure(output, "Auto-detect failed",
+                       "Expected: Date representation",
+                       "Actual: Error or failure",
+                       preview=200)
+    return failure(output, "Unexpected output",
+                   "Expected: Date format from [NSDate date]",
+                   preview=200)
+
+
+# Auto-detect instance method on variable
+validate_auto_detect_instance_method = partial(
+    _check_any_token,
+    tokens=('AutoDetectTest',),
+    success="Auto-detected instance method returned description",
+    error=("Auto-detect instance method failed",
+           "Expected: 'AutoDetectTest' in output",
+           "Actual: Error encountered"),
+    error_re=ERROR_RE,
+    missing=("Instance description not found",
+             "Expected: 'AutoDetectTest' from description"),
+    preview=200)
+
+
+def validate_variable_name_in_output(output):
     """Validator that output includes variable name like $N."""
-    def validator(output):
-        # Look for pattern like ($N) = in the output
-        if re.search(r'\$\d+\s*=', output):
-            return True, "Variable name found in output"
-        return False, (f"Variable name not found\n"
-                      f"    Expected: '$N =' pattern in output\n"
-                      f"    Actual: No variable name pattern found\n"
-                      f"    Output preview: {output[:300]}")
-    return validator
+    # Look for pattern like ($N) = in the output
+    if _VAR_RE.search(output):
+        return True, "Variable name found in output"
+    return failure(output, "Variable name not found",
+                   "Expected: '$N =' pattern in output",
+                   "Actual: No variable name pattern found")
 
 
 # =============================================================================
 # Expression Evaluation Validators
 # =============================================================================
 
-def validate_string_literal():
+def validate_string_literal(output):
     """Validator for Objective-C string literal evaluation."""
-    def validator(output):
-        # Should return NSTaggedPointerString or NSString with the literal value
-        if 'Test' in output and ('NSTaggedPointerString' in output or 'NSString' in output or '__NSCFConstantString' in output):
-            return True, "String literal evaluated correctly"
-        elif 'Test' in output and '0x' in output:
-            # Got the string value with an address - good enough
-            return True, "String literal returned with address"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"Expression evaluation failed\n"
-                          f"    Expected: 'Test' string with NSString type\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:300]}")
-        return False, (f"String literal not properly evaluated\n"
-                      f"    Expected: 'Test' and NSString/NSTaggedPointerString in output\n"
-                      f"    Actual: Not found\n"
-                      f"    Output preview: {output[:300]}")
-    return validator
-
-
-def validate_number_literal():
+    # Should return NSTaggedPointerString or NSString with the literal value
+    if 'Test' in output and ('NSTaggedPointerString' in output or 'NSString' in output or '__NSCFConstantString' in output):
+        return True, "String literal evaluated correctly"
+    elif 'Test' in output and '0x' in output:
+        # Got the string value with an address - good enough
+        return True, "String literal returned with address"
+    elif _ERR_FAILED_RE.search(output):
+        return failure(output, "Expression evaluation failed",
+                       "Expected: 'Test' string with NSString type",
+                       "Actual: Error encountered")
+    return failure(output, "String literal not properly evaluated",
+                   "Expected: 'Test' and NSString/NSTaggedPointerString in output",
+                   "Actual: Not found")
+
+
+def validate_number_literal(output):
     """Validator for NSNumber literal evaluation."""
-    def validator(output):
-        # Should return NSNumber with the value 42
-        if '42' in output and ('NSNumber' in output or '__NSCFNumber' in output or '0x' in output):
-            return True, "Number literal evaluated correctly"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"Number literal evaluation failed\n"
-                          f"    Expected: NSNumber with value 42\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:300]}")
-        return False, (f"Number literal not properly evaluated\n"
-                      f"    Expected: '42' in output\n"
-                      f"    Actual: Not found\n"
-                      f"    Output preview: {output[:300]}")
-    return validator
-
-
-def validate_array_literal():
+    # Should return NSNumber with the value 42
+    if '42' in output and ('NSNumber' in output or '__NSCFNumber' in output or '0x' in output):
+        return True, "Number literal evaluated correctly"
+    elif _ERR_FAILED_RE.search(output):
+        return failure(output, "Number literal evaluation failed",
+                       "Expected: NSNumber with value 42",
+                       "Actual: Error encountered")
+    return failure(output, "Number literal not properly evaluated",
+                   "Expected: '42' in output",
+                   "Actual: Not found")
+
+
+def validate_array_literal(output):
     """Validator for NSArray literal evaluation."""
-    def validator(output):
-        # Should return an NSArray with elements
-        if ('NSArray' in output or '__NSArrayI' in output or '__NSArray' in output) and '0x' in output:
-            return True, "Array literal evaluated correctly"
-        elif 'one' in output.lower() and 'two' in output.lower():
-            # Array contents visible
-            return True, "Array literal with contents visible"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"Array literal evaluation failed\n"
-                          f"    Expected: NSArray in output\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:300]}")
-        return False, (f"Array literal not properly evaluated\n"
-                      f"    Expected: NSArray type or array contents in output\n"
-                      f"    Actual: Not found\n"
-                      f"    Output preview: {output[:300]}")
-    return validator
-
-
-def validate_dictionary_literal():
+    # Should return an NSArray with elements
+    if ('NSArray' in output or '__NSArrayI' in output or '__NSArray' in output) and '0x' in output:
+        return True, "Array literal evaluated correctly"
+    elif all(pattern.search(output) for pattern in _ARRAY_ITEM_RES):
+        # Array contents visible
+        return True, "Array literal with contents visible"
+    elif _ERR_FAILED_RE.search(output):
+        return failure(output, "Array literal evaluation failed",
+                       "Expected: NSArray in output",
+                       "Actual: Error encountered")
+    return failure(output, "Array literal not properly evaluated",
+                   "Expected: NSArray type or array contents in output",
+                   "Actual: Not found")
+
+
+def validate_dictionary_literal(output):
     """Validator for NSDictionary literal evaluation."""
-    def validator(output):
-        # Should return an NSDictionary
-        if ('NSDictionary' in output or '__NSDictionary' in output) and '0x' in output:
-            return True, "Dictionary literal evaluated correctly"
-        elif 'key' in output.lower() and 'value' in output.lower():
-            # Dictionary contents visible
-            return True, "Dictionary literal with contents visible"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"Dictionary literal evaluation failed\n"
-                          f"    Expected: NSDictionary in output\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:300]}")
-        return False, (f"Dictionary literal not properly evaluated\n"
-                      f"    Expected: NSDictionary type or dictionary contents in output\n"
-                      f"    Actual: Not found\n"
-                      f"    Output preview: {output[:300]}")
-    return validator
-
-
-def validate_boxed_expression():
+    # Should return an NSDictionary
+    if ('NSDictionary' in output or '__NSDictionary' in output) and '0x' in output:
+        return True, "Dictionary literal evaluated correctly"
+    elif all(pattern.search(output) for pattern in _DICT_ITEM_RES):
+        # Dictionary contents visible
+        return True, "Dictionary literal with contents visible"
+    elif _ERR_FAILED_RE.search(output):
+        return failure(output, "Dictionary literal evaluation failed",
+                       "Expected: NSDictionary in output",
+                       "Actual: Error encountered")
+    return failure(output, "Dictionary literal not properly evaluated",
+                   "Expected: NSDictionary type or dictionary contents in output",
+                   "Actual: Not found")
+
+
+def validate_boxed_expression(output):
     """Validator for boxed expression evaluation like @(1+1)."""
-    def validator(output):
-        # Should return NSNumber with value 2
-        if '2' in output and ('NSNumber' in output or '__NSCFNumber' in output or '0x' in output):
-            return True, "Boxed expression evaluated correctly"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"Boxed expression evaluation failed\n"
-                          f"    Expected: NSNumber with value 2\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:300]}")
-        return False, (f"Boxed expression not properly evaluated\n"
-                      f"    Expected: '2' in output\n"
-                      f"    Actual: Not found\n"
-                      f"    Output preview: {output[:300]}")
-    return validator
-
-
-def validate_nested_expression():
+    # Should return NSNumber with value 2
+    if '2' in output and ('NSNumber' in output or '__NSCFNumber' in output or '0x' in output):
+        return True, "Boxed expression evaluated correctly"
+    elif _ERR_FAILED_RE.search(output):
+        return failure(output, "Boxed expression evaluation failed",
+                       "Expected: NSNumber with value 2",
+                       "Actual: Error encountered")
+    return failure(output, "Boxed expression not properly evaluated",
+                   "Expected: '2' in output",
+                   "Actual: Not found")
+
+
+def validate_nested_expression(output):
     """Validator for nested message send expression."""
-    def validator(output):
-        # [[NSDate date] description] should return a date string
-        if re.search(r'\d{4}-\d{2}-\d{2}|\d{2}:\d{2}:\d{2}', output):
-            return True, "Nested expression evaluated correctly"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"Nested expression evaluation failed\n"
-                          f"    Expected: Date string in output\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:300]}")
-        return False, (f"Nested expression not properly evaluated\n"
-                      f"    Expected: Date string in output\n"
-                      f"    Actual: Not found\n"
-                      f"    Output preview: {output[:300]}")
-    return validator
-
-
-def validate_c_function_call():
-    """Validator for C function call within expression."""
-    def validator(output):
-        # NSHomeDirectory() should return a path string
-        if '/Users/' in output or '/var/' in output or '/home/' in output:
-            return True, "C function call evaluated correctly"
-        elif 'error' in output.lower() or 'failed' in output.lower():
-            return False, (f"C function call evaluation failed\n"
-                          f"    Expected: Home directory path\n"
-                          f"    Actual: Error encountered\n"
-                          f"    Output preview: {output[:300]}")
-        return False, (f"C function call not properly evaluated\n"
-                      f"    Expected: Path string in output\n"
-                      f"    Actual: Not found\n"
-                      f"    Output preview: {output[:300]}")
-    return validator
+    # [[NSDate date] description] should return a date string
+    if _DATE_ONLY_RE.search(output):
+        return True, "Nested expression evaluated correctly"
+    elif _ERR_FAILED_RE.search(output):
+        return failure(output, "Nested expression evaluation failed",
+                       "Expected: Date string in output",
+                       "Actual: Error encountered")
+    return failure(output, "Nested expression not properly evaluated",
+                   "Expected: Date string in output",
+                   "Actual: Not found")
+
+
+# C function call within expression: NSHomeDirectory() returns a path
+validate_c_function_call = partial(
+    _check_any_token,
+    tokens=('/Users/', '/var/', '/home/'),
+    success="C function call evaluated correctly",
+    error=("C function call evaluation failed",
+           "Expected: Home directory path",
+           "Actual: Error encountered"),
+    missing=("C function call not properly evaluated",
+             "Expected: Path string in output",
+             "Actual: Not found"))
 
 
 # =============================================================================
 # Test Specifications
 # =============================================================================
 
-def get_test_specs():
-    """Return list of test specifications."""
-    return [
-        # Basic class methods
-        (
-            "Class method: +[NSDate date]",
-            ['ocall +[NSDate date]'],
-            validate_class_method_basic()
-        ),
+# Validators are plain functions of the output, so the specs are an
+# immutable constant built once at import
+TEST_SPECS = (
+    # Basic class methods
+    (
+        "Class method: +[NSDate date]",
+        ('ocall +[NSDate date]',),
+        validate_class_method_basic
+    ),
+    (
+        "Class method with arg: +[NSString stringWithString:]",
+        ('ocall +[NSString stringWithString:@"hello"]',),
+        validate_class_method_with_arg
+    ),
+    # Instance methods
+    (
+        "Instance method from variable",
         (
-            "Class method with arg: +[NSString stringWithString:]",
-            ['ocall +[NSString stringWithString:@"hello"]'],
-            validate_class_method_with_arg()
+            'expr NSString *$testStr = @"TestString"',
+            'ocall -[$testStr description]'
         ),
-        # Instance methods
+        validate_instance_method_from_variable
+    ),
+    (
+        "Instance method from register ($x0)",
+        ('ocall -[$x0 description]',),
+        validate_instance_method_from_register
+    ),
+    # Verbose mode
+    (
+        "Verbose mode: --verbose flag",
+        ('ocall --verbose +[NSDate date]',),
+        validate_verbose_mode
+    ),
+    # Private classes
+    (
+        "Private class: +[IDSService class]",
+        ('ocall +[IDSService class]',),
+        validate_private_class
+    ),
+    # Error handling
+    (
+        "Error: invalid class",
+        ('ocall +[NonExistentClass123 someMethod]',),
+        validate_invalid_class
+    ),
+    (
+        "Error: invalid syntax",
+        ('ocall invalid syntax here',),
+        validate_invalid_syntax
+    ),
+    # Return values
+    (
+        "Return value display",
+        ('ocall +[NSNumber numberWithInt:42]',),
+        validate_return_value
+    ),
+    # Address prefix in output
+    (
+        "Address prefix: output starts with hex address",
+        ('ocall +[NSDate date]',),
+        validate_address_prefix
+    ),
+    (
+        "Address prefix: po on address matches ocall description",
         (
-            "Instance method from variable",
-            [
-                'expr NSString *$testStr = @"TestString"',
-                'ocall -[$testStr description]'
-            ],
-            validate_instance_method_from_variable()
+            'expr NSDate *$testDate = [NSDate date]',
+            'ocall -[$testDate description]',
+            'po $testDate'
         ),
+        validate_address_matches_po
+    ),
+    # Auto-detect method type
+    (
+        "Auto-detect: class method [NSDate date]",
+        ('ocall [NSDate date]',),
+        validate_auto_detect_class_method
+    ),
+    (
+        "Auto-detect: instance method on $variable",
         (
-            "Instance method from register ($x0)",
-            ['ocall -[$x0 description]'],
-            validate_instance_method_from_register()
+            'expr NSString *$autoStr = @"AutoDetectTest"',
+            'ocall [$autoStr description]'
         ),
-        # Verbose mode
-        (
-            "Verbose mode: --verbose flag",
-            ['ocall --verbose +[NSDate date]'],
-            validate_verbose_mode()
-        ),
-        # Private classes
-        (
-            "Private class: +[IDSService class]",
-            ['ocall +[IDSService class]'],
-            validate_private_class()
-        ),
-        # Error handling
-        (
-            "Error: invalid class",
-            ['ocall +[NonExistentClass123 someMethod]'],
-            validate_invalid_class()
-        ),
-        (
-            "Error: invalid syntax",
-            ['ocall invalid syntax here'],
-            validate_invalid_syntax()
-        ),
-        # Return values
-        (
-            "Return value display",
-            ['ocall +[NSNumber numberWithInt:42]'],
-            validate_return_value()
-        ),
-        # Address prefix in output
-        (
-            "Address prefix: output starts with hex address",
-            ['ocall +[NSDate date]'],
-            validate_address_prefix()
-        ),
-        (
-            "Address prefix: po on address matches ocall description",
-            [
-                'expr NSDate *$testDate = [NSDate date]',
-                'ocall -[$testDate description]',
-                'po $testDate'
-            ],
-            validate_address_matches_po()
-        ),
-        # Auto-detect method type
-        (
-            "Auto-detect: class method [NSDate date]",
-            ['ocall [NSDate date]'],
-            validate_auto_detect_class_method()
-        ),
-        (
-            "Auto-detect: instance method on $variable",
-            [
-                'expr NSString *$autoStr = @"AutoDetectTest"',
-                'ocall [$autoStr description]'
-            ],
-            validate_auto_detect_instance_method()
-        ),
-        # Variable name in output
-        (
-            "Output format: includes variable name $N",
-            ['ocall +[NSDate date]'],
-            validate_variable_name_in_output()
-        ),
-        # Expression evaluation (arbitrary Objective-C expressions)
-        (
-            "Expression: string literal @\"Test\"",
-            ['ocall @"Test"'],
-            validate_string_literal()
-        ),
-        (
-            "Expression: NSNumber literal @42",
-            ['ocall @42'],
-            validate_number_literal()
-        ),
-        (
-            "Expression: NSArray literal @[@\"one\", @\"two\"]",
-            ['ocall @[@"one", @"two"]'],
-            validate_array_literal()
-        ),
-        (
-            "Expression: NSDictionary literal @{@\"key\": @\"value\"}",
-            ['ocall @{@"key": @"value"}'],
-            validate_dictionary_literal()
-        ),
-        (
-            "Expression: boxed expression @(1+1)",
-            ['ocall @(1+1)'],
-            validate_boxed_expression()
-        ),
-        (
-            "Expression: nested message send [[NSDate date] description]",
-            ['ocall [[NSDate date] description]'],
-            validate_nested_expression()
-        ),
-        (
-            "Expression: C function call NSHomeDirectory()",
-            ['ocall NSHomeDirectory()'],
-            validate_c_function_call()
-        ),
-    ]
+        validate_auto_detect_instance_method
+    ),
+    # Variable name in output
+    (
+        "Output format: includes variable name $N",
+        ('ocall +[NSDate date]',),
+        validate_variable_name_in_output
+    ),
+    # Expression evaluation (arbitrary Objective-C expressions)
+    (
+        "Expression: string literal @\"Test\"",
+        ('ocall @"Test"',),
+        validate_string_literal
+    ),
+    (
+        "Expression: NSNumber literal @42",
+        ('ocall @42',),
+        validate_number_literal
+    ),
+    (
+        "Expression: NSArray literal @[@\"one\", @\"two\"]",
+        ('ocall @[@"one", @"two"]',),
+        validate_array_literal
+    ),
+    (
+        "Expression: NSDictionary literal @{@\"key\": @\"value\"}",
+        ('ocall @{@"key": @"value"}',),
+        validate_dictionary_literal
+    ),
+    (
+        "Expression: boxed expression @(1+1)",
+        ('ocall @(1+1)',),
+        validate_boxed_expression
+    ),
+    (
+        "Expression: nested message send [[NSDate date] description]",
+        ('ocall [[NSDate date] description]',),
+        validate_nested_expression
+    ),
+    (
+        "Expression: C function call NSHomeDirectory()",
+        ('ocall NSHomeDirectory()',),
+        validate_c_function_call
+    ),
+)
+
+
+def get_test_specs():
+    """Return the tuple of test specifications."""
+    return TEST_SPECS
 
 
 def main():
     """Run all ocall tests using shared LLDB session."""
     # Check if objc_call.py exists
-    objc_call_path = os.path.join(PROJECT_ROOT, 'objc_call.py')
-    if not os.path.exists(objc_call_path):
-        print(f"Note: {objc_call_path} not found")
+    if not os.path.exists(_OBJC_CALL_PATH):
+        print(f"Note: {_OBJC_CALL_PATH} not found")
         print("These tests are for the upcoming ocall feature.")
         print("Tests will fail until the feature is implemented.\n")
 
@@ -559,7 +548,7 @@ def main():
     passed, total = run_shared_test_suite(
         "OCALL COMMAND TEST SUITE",
         get_test_specs(),
-        scripts=['scripts/objc_call.py'],
+        scripts=[_OBJC_CALL_SCRIPT],
         show_category_summary=categories
     )
     sys.exit(0 if passed == total else 1)
@@ -5,9 +5,11 @@ These tests cover string parsing, formatting, and manipulation logic
 that doesn't require LLDB runtime.
 """
 
+import importlib
 import pytest
 import sys
 import os
+import types
 
 # Add scripts directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../scripts'))
@@ -139,6 +141,15 @@ class TestParseMethodSignature:
         assert sel == 'length'
         assert err is None
 
+    @pytest.mark.parsing
+    def test_parse_whitespace_inside_brackets(self):
+        """Should ignore whitespace just inside the brackets."""
+        is_inst, cls, sel, err = parse_method_signature('+[ NSDate  date ]')
+        assert is_inst is False
+        assert cls == 'NSDate'
+        assert sel == 'date'
+        assert err is None
+
     @pytest.mark.parsing
     def test_parse_no_closing_bracket(self):
         """Should handle missing closing bracket."""
@@ -148,6 +159,17 @@ class TestParseMethodSignature:
         assert sel == 'length'
         assert err is None
 
+    @pytest.mark.parsing
+    @pytest.mark.parametrize("signature", ['-[Foo ]', '-[Foo  ]'])
+    def test_parse_invalid_missing_selector(self, signature):
+        """Should return error if only the closing bracket follows the class."""
+        is_inst, cls, sel, err = parse_method_signature(signature)
+        assert is_inst is None
+        assert cls is None
+        assert sel is None
+        assert err is not None
+        assert 'Invalid format' in err
+
 
 class TestFormatMethodName:
     """Tests for format_method_name() function."""
@@ -358,3 +380,93 @@ class TestParseMethodSignatureParametrized:
         assert cls == '[NSString'
         assert sel == 'length]'
         assert err is None
+
+
+class _FakeError:
+    """Stand-in for lldb.SBError: never failed."""
+
+    def Fail(self):
+        return False
+
+
+class _FakeValue:
+    """Stand-in for the lldb.SBValue returned by a successful expression."""
+
+    def __init__(self, address):
+        self.address = address
+
+    def IsValid(self):
+        return True
+
+    def GetError(self):
+        return _FakeError()
+
+    def GetValueAsUnsigned(self):
+        return self.address
+
+    def GetValue(self):
+        return f"0x{self.address:016x}"
+
+
+class _FakeFrame:
+    """Stand-in for lldb.SBFrame answering expressions with queued addresses."""
+
+    def __init__(self, *addresses):
+        self.results = [_FakeValue(address) for address in addresses]
+
+    def EvaluateExpression(self, expression, options):
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def objc_utils(monkeypatch):
+    """Import objc_utils with a placeholder lldb module (no LLDB runtime here)."""
+    if 'objc_utils' not in sys.modules:
+        monkeypatch.setitem(sys.modules, 'lldb', types.ModuleType('lldb'))
+    module = importlib.import_module('objc_utils')
+    monkeypatch.setattr(module, 'get_expression_options', lambda: None)
+    return module
+
+
+class TestEvaluateMethodPointersStepwise:
+    """Tests for _evaluate_method_pointers_stepwise() with a fake frame."""
+
+    @pytest.mark.utils
+    def test_zero_imp_verbose_reports_not_found(self, objc_utils, capsys):
+        """A zero IMP in verbose mode prints it and reports the missing implementation."""
+        frame = _FakeFrame(0x1000, 0x2000, 0)
+        class_ptr, sel_ptr, imp_addr, imp_display, error = \
+            objc_utils._evaluate_method_pointers_stepwise(
+                frame, 'NSString', 'length', True, verbose=True)
+        assert (class_ptr, sel_ptr, imp_addr, imp_display) == (0x1000, 0x2000, 0, None)
+        assert error == "Method implementation not found"
+        assert "IMP: 0x0000000000000000" in capsys.readouterr().out
+
+
+class _FakeProcess:
+    """Stand-in for lldb.SBProcess identified by its unique ID."""
+
+    def __init__(self, uid):
+        self.uid = uid
+
+    def GetUniqueID(self):
+        return self.uid
+
+
+class TestProcessCache:
+    """Tests for _process_cache() keying and eviction."""
+
+    @pytest.mark.utils
+    def test_entries_kept_for_same_process(self, objc_utils):
+        """The same process gets the same entries back."""
+        cache = {}
+        objc_utils._process_cache(cache, _FakeProcess(1))['NSString'] = 0x1000
+        assert objc_utils._process_cache(cache, _FakeProcess(1)) == {'NSString': 0x1000}
+
+    @pytest.mark.utils
+    def test_new_process_drops_old_entries(self, objc_utils):
+        """A different process starts empty and evicts the previous one."""
+        cache = {}
+        objc_utils._process_cache(cache, _FakeProcess(1))['NSString'] = 0x1000
+        assert objc_utils._process_cache(cache, _FakeProcess(2)) == {}
+        assert list(cache) == [2]